@@ -4,6 +4,7 @@ SonicVault CLI - Command Line Interface for Secure Audio Steganography
 """
 
 import argparse
+import logging
 import sys
 import os
 from pathlib import Path
@@ -11,9 +12,8 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from core.sonic_vault import SonicVault
-from crypto.aes_manager import AESManager
-from crypto.dsa_manager import DSAManager
+# Heavy modules (cryptography, numpy, scipy, pydub) are imported inside the
+# command handlers so that `--help` and argument errors stay fast.
 
 def main():
     """Main CLI entry point."""
@@ -33,12 +33,62 @@ Examples:
 
   # Get system info
   python cli.py info
+
+  # Show each pipeline step while encoding
+  python cli.py --verbose encode "Meet at midnight" secret.wav --password MyPass123
         """
     )
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Show progress of each pipeline step')
     
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
     
-    # Encode command
+    # Only build the subparser that will actually run; fall back to the
+    # full set for top-level help or an unknown/missing command.
+    command = _sniff_subcommand(sys.argv[1:])
+    if command is not None:
+        SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for build in SUBPARSER_BUILDERS.values():
+            build(subparsers)
+    
+    args = parser.parse_args()
+    
+    # Pipeline progress is logged at INFO; only warnings show by default
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(message)s")
+    
+    if not args.command:
+        parser.print_help()
+        return
+    
+    try:
+        if args.command == 'encode':
+            encode_message(args)
+        elif args.command == 'decode':
+            decode_message(args)
+        elif args.command == 'generate-keys':
+            generate_keys(args)
+        elif args.command == 'info':
+            show_info()
+        elif args.command == 'themes':
+            show_themes()
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+def _sniff_subcommand(argv):
+    """Return the first known subcommand in argv, or None for help/unknown."""
+    for token in argv:
+        if token in ('-h', '--help'):
+            return None
+        if token in SUBPARSER_BUILDERS:
+            return token
+    return None
+
+def _build_encode_parser(subparsers):
+    """Add the 'encode' subcommand."""
     encode_parser = subparsers.add_parser('encode', help='Encode a message into audio')
     encode_parser.add_argument('message', help='Message to encode')
     encode_parser.add_argument('output', help='Output audio file path')
@@ -50,61 +100,58 @@ Examples:
                               help='Add digital signature')
     encode_parser.add_argument('--private-key', '-k', 
                               help='Private key file for signing')
-    
-    # Decode command  
+
+def _build_decode_parser(subparsers):
+    """Add the 'decode' subcommand."""
     decode_parser = subparsers.add_parser('decode', help='Decode a message from audio')
     decode_parser.add_argument('input', help='Input audio file path')
     decode_parser.add_argument('--password', '-p', required=True, help='Decryption password')
     decode_parser.add_argument('--public-key', '-k', 
                               help='Public key file for signature verification')
-    
-    # Generate keys command
+
+def _build_keys_parser(subparsers):
+    """Add the 'generate-keys' subcommand."""
     keys_parser = subparsers.add_parser('generate-keys', help='Generate encryption key pair')
     keys_parser.add_argument('--output', '-o', default='sonic_vault_keys',
                            help='Output base name for key files')
     keys_parser.add_argument('--password', '-p', 
                            help='Password to protect private key')
-    
-    # Info command
+
+def _build_info_parser(subparsers):
+    """Add the 'info' subcommand."""
     subparsers.add_parser('info', help='Show system information')
-    
-    # Themes command
+
+def _build_themes_parser(subparsers):
+    """Add the 'themes' subcommand."""
     subparsers.add_parser('themes', help='List available audio themes')
-    
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        return
-    
-    try:
-        vault = SonicVault()
-        
-        if args.command == 'encode':
-            encode_message(vault, args)
-        elif args.command == 'decode':
-            decode_message(vault, args)
-        elif args.command == 'generate-keys':
-            generate_keys(vault, args)
-        elif args.command == 'info':
-            show_info(vault)
-        elif args.command == 'themes':
-            show_themes(vault)
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
 
-def encode_message(vault, args):
+SUBPARSER_BUILDERS = {
+    'encode': _build_encode_parser,
+    'decode': _build_decode_parser,
+    'generate-keys': _build_keys_parser,
+    'info': _build_info_parser,
+    'themes': _build_themes_parser,
+}
+
+def encode_message(args):
     """Encode a message into audio."""
     print("🔐 SonicVault - Encoding Secure Message")
     print("=" * 50)
     
+    # Cheap length check first, so short passwords are rejected before the
+    # crypto/audio stack is imported and initialized
+    if len(args.password) < 8:
+        _reject_password("Password must be at least 8 characters long")
+        return
+    
+    from core.sonic_vault import SonicVault
+
+    vault = SonicVault()
+    
     # Validate password strength
     is_valid, msg = vault.validate_password(args.password)
     if not is_valid:
-        print(f"❌ Password too weak: {msg}")
-        print("💡 Please use a stronger password (min 8 chars with mix of characters)")
+        _reject_password(msg)
         return
     
     # Handle private key password if signing
@@ -134,8 +181,17 @@ def encode_message(vault, args):
         print(f"🔑 Private key: {result['private_key_path']}")
         print(f"🔑 Public key: {public_key}")
 
-def decode_message(vault, args):
+def _reject_password(msg):
+    """Report a password that failed the strength check."""
+    print(f"❌ Password too weak: {msg}")
+    print("💡 Please use a stronger password (min 8 chars with mix of characters)")
+
+def decode_message(args):
     """Decode a message from audio."""
+    from core.sonic_vault import SonicVault
+
+    vault = SonicVault()
+
     print("🔐 SonicVault - Decoding Secure Message") 
     print("=" * 50)
     
@@ -162,8 +218,12 @@ def decode_message(vault, args):
         print("❌ Failed to decode message")
         print(f"💬 Error: {result['message']}")
 
-def generate_keys(vault, args):
+def generate_keys(args):
     """Generate encryption key pair."""
+    from core.sonic_vault import SonicVault
+
+    vault = SonicVault()
+
     print("🔑 SonicVault - Generating Key Pair")
     print("=" * 50)
     
@@ -186,16 +246,20 @@ def generate_keys(vault, args):
     else:
         print("⚠️  Private key is NOT password-protected")
 
-def show_info(vault):
+def show_info():
     """Show system information."""
+    from core.sonic_vault import SonicVault
+
     print("🔐 SonicVault - System Information")
     print("=" * 50)
     
-    info = vault.get_system_info()
+    # Static data: no need to build the crypto/audio components
+    info = SonicVault.get_system_info()
     
     print(f"🔄 Version: {info['version']}")
     print("\n🔧 Components:")
     print(f"  • Encryption: {info['components']['aes_encryption']}")
+    print(f"  • AES Backend: {info['components']['aes_backend']}")
     print(f"  • Signatures: {info['components']['dsa_signatures']}")
     print(f"  • Audio Themes: {len(info['components']['audio_themes'])} available")
     print(f"  • Morse Support: {info['components']['morse_support']} characters")
@@ -204,12 +268,14 @@ def show_info(vault):
     for theme in info['components']['audio_themes']:
         print(f"  • {theme}")
 
-def show_themes(vault):
+def show_themes():
     """List available audio themes."""
+    from core.sonic_vault import SonicVault
+
     print("🎵 SonicVault - Available Audio Themes")
     print("=" * 50)
     
-    themes = vault.get_audio_themes()
+    themes = SonicVault.get_audio_themes()
     
     for theme in themes:
         print(f"• {theme}")
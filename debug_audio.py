@@ -8,9 +8,23 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from src.audio.audio_analyzer import AudioAnalyzer
 from src.audio.binary_encoder import BinaryEncoder
 
+# Cache the timing analysis across debug runs (joblib is optional)
+try:
+    from joblib import Memory
+    memory = Memory('.cache/sonic_vault', verbose=0)
+except ImportError:
+    memory = None
+
+def cached(func):
+    return memory.cache(func) if memory is not None else func
+
+@cached
+def analyze(audio_file, mtime):
+    """Timing analysis keyed on the file's mtime so a rewritten file is re-analyzed."""
+    return AudioAnalyzer().analyze_timing_patterns_simple(audio_file)
+
 # Analyze the audio file
-analyzer = AudioAnalyzer()
-timings = analyzer.analyze_timing_patterns_simple('test_short.wav')
+timings = analyze('test_short.wav', os.path.getmtime('test_short.wav'))
 
 print(f"Total timing patterns detected: {len(timings)}")
 print(f"\nFirst 10 patterns (signal_duration, gap_duration):")
@@ -50,10 +50,17 @@ setup(
         "dev": [
             "pytest>=8.0.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
         ],
+        "fast": [
+            "numba>=0.57.0",
+        ],
+        "argon2": [
+            "argon2-cffi>=21.3.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -2,14 +2,29 @@
 Audio processing module for SonicVault.
 """
 
-from .audio_analyzer import AudioAnalyzer
-from .binary_encoder import BinaryEncoder
-from .sound_generator import SoundGenerator
-from .timing_detector import TimingDetector
+import importlib
+
+# Exported name -> defining submodule. Submodules are imported on first
+# access (PEP 562), so importing one of them does not also pull in pydub
+# and the rest through this package.
+_EXPORTS = {
+    'AudioAnalyzer': 'audio_analyzer',
+    'BinaryEncoder': 'binary_encoder',
+    'SoundGenerator': 'sound_generator',
+    'TimingDetector': 'timing_detector',
+}
 
 __all__ = [
     'AudioAnalyzer',
     'BinaryEncoder', 
     'SoundGenerator',
     'TimingDetector'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
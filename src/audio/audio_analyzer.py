@@ -3,10 +3,36 @@ Audio Analyzer for SonicVault
 Analyzes audio files to extract timing patterns for decoding.
 """
 
+import logging
 import numpy as np
+import soundfile as sf
 from pydub import AudioSegment
 from typing import List, Tuple, Dict, Any
 
+logger = logging.getLogger(__name__)
+
+# NumPy dtypes matching pydub's signed little-endian PCM sample widths
+_SAMPLE_DTYPES = {1: np.int8, 2: np.dtype('<i2'), 4: np.dtype('<i4')}
+
+def _aggregate_runs(run_states: np.ndarray, run_lengths: np.ndarray, frame_duration: float,
+                    sig_min: float, gap_min: float) -> List[Tuple[float, float]]:
+    """
+    Turn runs of signal/silence frames into (signal, gap) durations in seconds.
+    
+    Signal runs shorter than sig_min are dropped; a silence run of at least
+    gap_min becomes the gap of the most recent kept signal. There are only a
+    few hundred runs, so a plain loop over Python lists is plenty fast.
+    """
+    pairs = []
+    for is_signal, run_length in zip(run_states.tolist(), run_lengths.tolist()):
+        duration_seconds = run_length * frame_duration
+        if is_signal:
+            if duration_seconds >= sig_min:
+                pairs.append([duration_seconds, 0.0])
+        elif duration_seconds >= gap_min and pairs:
+            pairs[-1][1] = duration_seconds
+    return [tuple(pair) for pair in pairs]
+
 class AudioAnalyzer:
     """
     Analyzes audio files to detect timing patterns of Morse code signals.
@@ -23,21 +49,55 @@ class AudioAnalyzer:
         SIMPLE AND ROBUST timing pattern analysis.
         """
         try:
+            # WAV fast path: libsndfile decodes straight to normalized float32
+            # without pydub's parsing (or an ffmpeg subprocess for other formats)
+            if audio_file.lower().endswith('.wav'):
+                samples = self._read_wav(audio_file)
+                if samples is not None:
+                    return self._detect_timing_patterns_fixed(samples)
+            
             # Load audio file
             audio = AudioSegment.from_file(audio_file)
             
             # Convert to mono and set sample rate
             audio = audio.set_channels(1).set_frame_rate(self.sample_rate)
             
-            # Convert to numpy array
-            samples = np.array(audio.get_array_of_samples(), dtype=np.float32)
-            samples = samples / (2**15)  # Normalize for 16-bit audio
+            # Convert to numpy array. No 2**15 normalization: the detector
+            # thresholds relative to the peak frame energy, so scale is irrelevant
+            samples = self._sample_view(audio).astype(np.float32)
             
             return self._detect_timing_patterns_fixed(samples)
             
         except Exception as e:
             raise Exception(f"Audio analysis failed: {e}")
     
+    def _read_wav(self, audio_file: str):
+        """
+        Read a WAV file as mono float32 samples in [-1, 1].
+        
+        Returns None when the file needs pydub instead (resampling or a
+        format libsndfile cannot read).
+        """
+        try:
+            samples, sample_rate = sf.read(audio_file, dtype='float32', always_2d=False)
+        except RuntimeError:
+            return None
+        if sample_rate != self.sample_rate:
+            return None
+        if samples.ndim > 1:
+            samples = samples.mean(axis=1)
+        return samples
+    
+    @staticmethod
+    def _sample_view(audio: AudioSegment) -> np.ndarray:
+        """
+        Return the segment's samples as a read-only integer view of its raw bytes.
+        """
+        dtype = _SAMPLE_DTYPES.get(audio.sample_width)
+        if dtype is None:
+            return np.array(audio.get_array_of_samples())
+        return np.frombuffer(audio.raw_data, dtype=dtype)
+    
     def analyze_timing_patterns_robust(self, audio_file: str) -> List[Tuple[float, float]]:
         """
         Use simple method for now - it's more reliable.
@@ -55,59 +115,34 @@ class AudioAnalyzer:
         frame_length = int(0.1 * self.sample_rate)  # 100ms frames
         frame_duration = frame_length / self.sample_rate
         
-        # Calculate frame energy
-        frame_energy = []
-        for i in range(0, len(samples), frame_length):
-            frame = samples[i:i + frame_length]
-            if len(frame) > 0:
-                energy = np.sqrt(np.mean(frame**2))
-                frame_energy.append(energy)
-        
-        if not frame_energy:
-            return []
-        
-        # Use fixed threshold based on maximum amplitude
-        max_energy = np.max(frame_energy)
-        energy_threshold = max_energy * 0.2  # 20% of peak - much more conservative
-        
-        # Simple state detection
-        is_signal = [energy > energy_threshold for energy in frame_energy]
+        # Calculate frame energy (mean square) for all frames into one
+        # preallocated array; the partial frame at the end (if any) takes the
+        # last slot. sqrt is monotonic, so thresholding the squared RMS
+        # against a squared threshold gives the same decision without it.
+        n_frames = len(samples) // frame_length
+        tail = samples[n_frames * frame_length:]
+        trimmed = samples[:n_frames * frame_length].reshape(n_frames, frame_length)
+        frame_energy_sq = np.empty(n_frames + (len(tail) > 0), dtype=np.result_type(samples, np.float32))
+        # einsum/dot fuse the square and the sum, so no squared temporary
+        np.einsum('ij,ij->i', trimmed, trimmed, out=frame_energy_sq[:n_frames])
+        frame_energy_sq[:n_frames] /= frame_length
+        if len(tail) > 0:
+            frame_energy_sq[-1] = np.dot(tail, tail) / len(tail)
         
-        # Group consecutive states
-        timing_patterns = []
-        current_state = is_signal[0]
-        current_duration = 1
+        # Signal frames exceed 20% of peak RMS - much more conservative
+        is_signal = frame_energy_sq > frame_energy_sq.max() * (0.2 ** 2)
         
-        for i in range(1, len(is_signal)):
-            if is_signal[i] == current_state:
-                current_duration += 1
-            else:
-                # State change - only add if it meets minimum duration
-                duration_seconds = current_duration * frame_duration
-                
-                if current_state:  # Signal ended
-                    # Only add signals that are at least 150ms (dot is 200ms)
-                    if duration_seconds >= 0.15:
-                        timing_patterns.append((duration_seconds, 0.0))
-                else:  # Silence ended
-                    # Only add gaps that are at least 100ms and we have a previous signal
-                    if duration_seconds >= 0.1 and timing_patterns:
-                        last_signal, last_gap = timing_patterns[-1]
-                        timing_patterns[-1] = (last_signal, duration_seconds)
-                
-                current_state = is_signal[i]
-                current_duration = 1
+        # Locate state transitions and split into runs of equal state
+        transitions = np.flatnonzero(np.diff(is_signal.astype(np.int8))) + 1
+        boundaries = np.concatenate(([0], transitions, [len(is_signal)]))
+        run_states = is_signal[boundaries[:-1]]
+        run_lengths = np.diff(boundaries)
         
-        # Handle final segment
-        if current_duration > 0:
-            duration_seconds = current_duration * frame_duration
-            if current_state and duration_seconds >= 0.15:
-                timing_patterns.append((duration_seconds, 0.0))
-            elif not current_state and duration_seconds >= 0.1 and timing_patterns:
-                last_signal, last_gap = timing_patterns[-1]
-                timing_patterns[-1] = (last_signal, duration_seconds)
+        # Pair signal runs (>= 150ms, dot is 200ms) with the silence (>= 100ms)
+        # that follows them
+        timing_patterns = _aggregate_runs(run_states, run_lengths, frame_duration, 0.15, 0.1)
         
-        print(f"   🔍 Audio Analysis: {len(timing_patterns)} patterns found")
+        logger.debug("Audio Analysis: %d patterns found", len(timing_patterns))
         return timing_patterns
 
     def analyze_audio_quality(self, audio_file: str) -> Dict[str, Any]:
@@ -116,14 +151,16 @@ class AudioAnalyzer:
         """
         try:
             audio = AudioSegment.from_file(audio_file)
-            samples = np.array(audio.get_array_of_samples(), dtype=np.float32)
-            samples = samples / (2**15)
+            view = self._sample_view(audio)
+            # Peak from the integer extremes; avoids a float copy and the
+            # int16 overflow of np.abs(-32768)
+            peak = max(int(view.max()), -int(view.min()))
             
             return {
                 'duration_seconds': len(audio) / 1000.0,
                 'sample_rate': audio.frame_rate,
                 'channels': audio.channels,
-                'max_amplitude': float(np.max(np.abs(samples))),
+                'max_amplitude': peak / (2**15),
             }
         except Exception as e:
             return {'error': str(e)}
\ No newline at end of file
@@ -4,8 +4,18 @@ Converts Morse code to binary timing patterns and vice versa.
 """
 
 import json
+import logging
+import numpy as np
 from typing import List, Tuple, Dict, Any
 
+logger = logging.getLogger(__name__)
+
+class _DeletingTable(dict):
+    """str.translate table that deletes every character it does not map."""
+    
+    def __missing__(self, key):
+        return None
+
 class BinaryEncoder:
     """
     Encodes binary data into timing patterns and decodes timing patterns back to binary.
@@ -26,10 +36,40 @@ class BinaryEncoder:
     CHAR_SEPARATOR = '/'
     WORD_SEPARATOR = '//'
     
+    # str.translate tables; characters outside each alphabet are deleted
+    _MORSE_TO_BINARY = _DeletingTable({ord('.'): DOT, ord('-'): DASH, ord(' '): ' '})
+    _BINARY_TO_MORSE = _DeletingTable({ord(DOT): '.', ord(DASH): '-', ord(CHAR_SEPARATOR): ' '})
+    
     def __init__(self, timing_config: Dict[str, Any] = None):
         self.timing_config = self.DEFAULT_TIMING.copy()
         if timing_config:
             self.timing_config.update(timing_config)
+        self._recompute_thresholds()
+
+    def _recompute_thresholds(self):
+        """
+        Cache durations (in seconds) and classification thresholds derived
+        from timing_config. Call again whenever timing_config changes.
+        """
+        self._dot_dur = self.timing_config['dot_duration'] / 1000.0
+        self._dash_dur = self.timing_config['dash_duration'] / 1000.0
+        self._element_gap_s = self.timing_config['element_gap'] / 1000.0
+        self._char_gap_s = self.timing_config['char_gap'] / 1000.0
+        self._word_gap_s = self.timing_config['word_gap'] / 1000.0
+        
+        # Threshold for signal classification
+        self._signal_threshold = (self._dot_dur + self._dash_dur) / 2.0
+        
+        # Gap thresholds - based on how gaps are accumulated in encoding:
+        # - element_gap (0.2s): between elements in a character
+        # - element_gap + char_gap (0.8s): between characters
+        # - element_gap + word_gap (1.2s): between words (max)
+        # Use midpoints to distinguish
+        element_gap = self._element_gap_s
+        char_gap = self._char_gap_s
+        word_gap = self._word_gap_s
+        self._char_gap_threshold = (element_gap + (element_gap + char_gap)) / 2.0  # 0.5s
+        self._word_gap_threshold = ((element_gap + char_gap) + (element_gap + word_gap)) / 2.0  # 1.0s
 
     def morse_to_binary(self, morse_code: str) -> str:
         """
@@ -37,29 +77,14 @@ class BinaryEncoder:
         """
         if not morse_code:
             return ""
-            
+        
+        # Per word, translate dots/dashes to bits in one C-level pass (dropping
+        # any other element characters), then rejoin the non-empty characters
         binary_parts = []
-        words = morse_code.split(' / ')  # Morse word separator
-        
-        for word in words:
-            chars = word.split(' ')  # Morse character separator
-            word_binary = []
-            
-            for morse_char in chars:
-                if not morse_char:
-                    continue
-                    
-                char_binary = []
-                for element in morse_char:
-                    if element == '.':
-                        char_binary.append(self.DOT)
-                    elif element == '-':
-                        char_binary.append(self.DASH)
-                if char_binary:
-                    word_binary.append(''.join(char_binary))
-            
+        for word in morse_code.split(' / '):  # Morse word separator
+            word_binary = self.CHAR_SEPARATOR.join(word.translate(self._MORSE_TO_BINARY).split())
             if word_binary:
-                binary_parts.append(self.CHAR_SEPARATOR.join(word_binary))
+                binary_parts.append(word_binary)
         
         return self.WORD_SEPARATOR.join(binary_parts)
 
@@ -69,29 +94,12 @@ class BinaryEncoder:
         """
         if not binary_data:
             return ""
-            
+        
         morse_parts = []
-        words = binary_data.split(self.WORD_SEPARATOR)
-        
-        for word in words:
-            chars = word.split(self.CHAR_SEPARATOR)
-            morse_chars = []
-            
-            for char_binary in chars:
-                if not char_binary:
-                    continue
-                    
-                morse_char = []
-                for bit in char_binary:
-                    if bit == self.DOT:
-                        morse_char.append('.')
-                    elif bit == self.DASH:
-                        morse_char.append('-')
-                if morse_char:
-                    morse_chars.append(''.join(morse_char))
-            
-            if morse_chars:
-                morse_parts.append(' '.join(morse_chars))
+        for word in binary_data.split(self.WORD_SEPARATOR):
+            morse_word = ' '.join(word.translate(self._BINARY_TO_MORSE).split())
+            if morse_word:
+                morse_parts.append(morse_word)
         
         return ' / '.join(morse_parts)
 
@@ -99,50 +107,42 @@ class BinaryEncoder:
         """
         Convert binary data to timing patterns for audio generation.
         """
-        timing_patterns = []
-        
-        i = 0
-        n = len(binary_data)
-        
-        while i < n:
-            if binary_data[i:i+2] == self.WORD_SEPARATOR:
-                # Word separator: add as gap after previous signal
-                if timing_patterns:
-                    last_signal, last_gap = timing_patterns[-1]
-                    timing_patterns[-1] = (last_signal, last_gap + self.timing_config['word_gap'] / 1000.0)
-                i += 2
-                
-            elif binary_data[i] == self.CHAR_SEPARATOR:
-                # Character separator: add as gap after previous signal
-                if timing_patterns:
-                    last_signal, last_gap = timing_patterns[-1]
-                    timing_patterns[-1] = (last_signal, last_gap + self.timing_config['char_gap'] / 1000.0)
-                i += 1
-                
-            elif binary_data[i] == self.DOT:
-                # Dot signal with element gap
-                signal_dur = self.timing_config['dot_duration'] / 1000.0
-                gap_dur = self.timing_config['element_gap'] / 1000.0
-                timing_patterns.append((signal_dur, gap_dur))
-                i += 1
-                
-            elif binary_data[i] == self.DASH:
-                # Dash signal with element gap
-                signal_dur = self.timing_config['dash_duration'] / 1000.0
-                gap_dur = self.timing_config['element_gap'] / 1000.0
-                timing_patterns.append((signal_dur, gap_dur))
-                i += 1
-                
-            else:
-                # Skip unknown characters
-                i += 1
+        if not binary_data:
+            return []
+        
+        # Work on the raw bytes; non-ASCII characters become '?' and are skipped
+        arr = np.frombuffer(binary_data.encode('ascii', 'replace'), dtype=np.uint8)
+        
+        dot = arr == ord(self.DOT)
+        dash = arr == ord(self.DASH)
+        is_signal = dot | dash
+        
+        # One (signal, gap) pair per dot/dash, each followed by an element gap
+        signals = np.where(dash[is_signal], self._dash_dur, self._dot_dur)
+        gaps = np.full(len(signals), self._element_gap_s)
+        
+        if len(signals) == 0:
+            return []
+        
+        # Separators: runs of slashes are consumed greedily from the left, so
+        # each pair is a word separator and an odd leftover a char separator
+        slash = arr == ord(self.CHAR_SEPARATOR)
+        positions = np.arange(len(arr))
+        run_start = slash & ~np.concatenate(([False], slash[:-1]))
+        offset = positions - np.maximum.accumulate(np.where(run_start, positions, 0))
+        next_slash = np.concatenate((slash[1:], [False]))
+        token = slash & (offset % 2 == 0)
+        
+        # Each separator extends the gap of the signal preceding it (if any)
+        owner = np.cumsum(is_signal)[token] - 1
+        extra = np.where(next_slash[token], self._word_gap_s, self._char_gap_s)
+        keep = owner >= 0
+        np.add.at(gaps, owner[keep], extra[keep])
         
         # Remove gap after the last signal
-        if timing_patterns:
-            last_signal, last_gap = timing_patterns[-1]
-            timing_patterns[-1] = (last_signal, 0.0)
+        gaps[-1] = 0.0
         
-        return timing_patterns
+        return list(zip(signals.tolist(), gaps.tolist()))
 
     def timing_to_binary(self, timings: List[Tuple[float, float]]) -> str:
         """
@@ -152,48 +152,31 @@ class BinaryEncoder:
         if not timings:
             return ""
         
-        # Get timing config in seconds
-        dot_dur = self.timing_config['dot_duration'] / 1000.0
-        dash_dur = self.timing_config['dash_duration'] / 1000.0
-        element_gap = self.timing_config['element_gap'] / 1000.0
-        char_gap = self.timing_config['char_gap'] / 1000.0
-        word_gap = self.timing_config['word_gap'] / 1000.0
+        arr = np.asarray(timings, dtype=np.float64).reshape(-1, 2)
+        signal_duration = arr[:, 0]
+        gap_duration = arr[:, 1]
         
-        # Thresholds for signal classification
-        signal_threshold = (dot_dur + dash_dur) / 2.0
+        # Up to three output bytes per pattern: the signal bit and a separator
+        # of up to two characters; unused slots stay 0 and are dropped below
+        out = np.zeros((len(arr), 3), dtype=np.uint8)
         
-        # Gap thresholds - based on how gaps are accumulated in encoding:
-        # - element_gap (0.2s): between elements in a character
-        # - element_gap + char_gap (0.8s): between characters
-        # - element_gap + word_gap (1.2s): between words (max)
-        # Use midpoints to distinguish
-        char_gap_threshold = (element_gap + (element_gap + char_gap)) / 2.0  # 0.5s
-        word_gap_threshold = ((element_gap + char_gap) + (element_gap + word_gap)) / 2.0  # 1.0s
+        # Handle signal: classify as dot or dash
+        out[:, 0] = np.where(signal_duration <= self._signal_threshold, ord(self.DOT), ord(self.DASH))
+        out[signal_duration <= 0, 0] = 0
         
-        binary_bits = []
+        # Handle gap: insert separators based on gap duration
+        # Only insert separators between signals (not after the last one)
+        has_sep = gap_duration > self._element_gap_s
+        has_sep[-1] = False
+        word_sep = has_sep & (gap_duration > self._word_gap_threshold)
+        char_sep = has_sep & ~word_sep & (gap_duration > self._char_gap_threshold)
+        out[word_sep | char_sep, 1] = ord(self.CHAR_SEPARATOR)
+        out[word_sep, 2] = ord(self.CHAR_SEPARATOR)
+        # Note: element_gap (smallest gap) doesn't get a separator
         
-        for i, (signal_duration, gap_duration) in enumerate(timings):
-            # Handle signal: classify as dot or dash
-            if signal_duration > 0:
-                if signal_duration <= signal_threshold:
-                    binary_bits.append(self.DOT)
-                else:
-                    binary_bits.append(self.DASH)
-            
-            # Handle gap: insert separators based on gap duration
-            # Only insert separators between signals (not after the last one)
-            if gap_duration > element_gap and i < len(timings) - 1:
-                # Classify gap and insert appropriate separator
-                if gap_duration > word_gap_threshold:
-                    # Word separator (largest gap)
-                    binary_bits.append(self.WORD_SEPARATOR)
-                elif gap_duration > char_gap_threshold:
-                    # Character separator (medium gap)
-                    binary_bits.append(self.CHAR_SEPARATOR)
-                # Note: element_gap (smallest gap) doesn't get a separator
-        
-        result = ''.join(binary_bits)
-        print(f"   🔍 Binary Conversion: {len(result)} bits")
+        # Drop the unused slots with a single C-level bytes pass and decode once
+        result = out.tobytes().translate(None, b'\x00').decode('ascii')
+        logger.debug("Binary Conversion: %d bits", len(result))
         return result
 
     def save_timing_config(self, filepath: str):
@@ -215,6 +198,7 @@ class BinaryEncoder:
                 cfg = json.load(f)
                 if isinstance(cfg, dict):
                     self.timing_config.update(cfg)
+                    self._recompute_thresholds()
                 else:
                     raise ValueError("Configuration file must contain a dictionary")
         except Exception as e:
@@ -3,12 +3,53 @@ Sound Generator for SonicVault
 Generates audio files from timing patterns with different sound themes.
 """
 
+import functools
+import itertools
 import numpy as np
-from scipy.io import wavfile
+import soundfile as sf
 import os
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 from pathlib import Path
 
+from utils.jit import HAVE_NUMBA
+
+__all__ = ['SoundGenerator', 'AudioSegment']
+
+def _fast_sin(phase: np.ndarray) -> np.ndarray:
+    """
+    Approximate sin(phase) in place with a parabolic fit plus one correction step.
+    
+    Max error is about 1e-3, well under what 16-bit PCM output can resolve
+    for these tones, at a fraction of the cost of libm sin.
+    
+    Args:
+        phase: Float array of angles in radians; overwritten with the result
+        
+    Returns:
+        np.ndarray: phase, now holding the sine values
+    """
+    scratch = np.multiply(phase, 1 / (2 * np.pi))
+    
+    # Range-reduce to [-pi, pi]
+    np.rint(scratch, out=scratch)
+    scratch *= 2 * np.pi
+    phase -= scratch
+    
+    # y = (4/pi) x - (4/pi^2) x|x|
+    np.abs(phase, out=scratch)
+    scratch *= phase
+    scratch *= 4 / np.pi ** 2
+    phase *= 4 / np.pi
+    phase -= scratch
+    
+    # y += 0.225 (y|y| - y)
+    np.abs(phase, out=scratch)
+    scratch *= phase
+    scratch -= phase
+    scratch *= 0.225
+    phase += scratch
+    return phase
+
 class AudioSegment:
     """Simple audio segment class for compatibility."""
     
@@ -20,47 +61,77 @@ class AudioSegment:
             audio_array: NumPy array of audio samples
             sample_rate: Sample rate in Hz
         """
-        self.audio_array = audio_array
+        self.audio_array = audio_array.astype(np.float32, copy=False)
         self.sample_rate = sample_rate
         self.channels = 1 if len(audio_array.shape) == 1 else audio_array.shape[1]
+        self.n_samples = self.audio_array.shape[0]
+        self._len_ms = (self.n_samples * 1000) // sample_rate
     
     def __len__(self):
         """Get duration in milliseconds."""
-        return int((len(self.audio_array) / self.sample_rate) * 1000)
+        return self._len_ms
     
     def __add__(self, other: 'AudioSegment') -> 'AudioSegment':
         """Concatenate two audio segments."""
-        if self.sample_rate != other.sample_rate:
+        return AudioSegment.concat([self, other])
+    
+    @classmethod
+    def concat(cls, segments: List['AudioSegment']) -> 'AudioSegment':
+        """
+        Concatenate any number of segments with a single allocation.
+        
+        Chaining `a + b + c ...` re-copies the growing result for every
+        segment; this sizes the output once and copies each source once.
+        
+        Args:
+            segments: Segments to join, in order (at least one)
+            
+        Returns:
+            AudioSegment: The joined audio
+        """
+        if not segments:
+            raise ValueError("No segments to concatenate")
+        sample_rate = segments[0].sample_rate
+        if any(segment.sample_rate != sample_rate for segment in segments):
             raise ValueError("Sample rates must match")
         
-        combined = np.concatenate([self.audio_array, other.audio_array])
-        return AudioSegment(combined, self.sample_rate)
+        combined = np.empty(sum(segment.n_samples for segment in segments), dtype=np.float32)
+        offset = 0
+        for segment in segments:
+            n = segment.n_samples
+            combined[offset:offset + n] = segment.audio_array
+            offset += n
+        return cls(combined, sample_rate)
     
     def overlay(self, other: 'AudioSegment') -> 'AudioSegment':
         """Overlay two audio segments (mix them)."""
         if self.sample_rate != other.sample_rate:
             raise ValueError("Sample rates must match")
         
-        # Pad the shorter one with zeros
-        max_len = max(len(self.audio_array), len(other.audio_array))
-        self_padded = np.pad(self.audio_array, (0, max_len - len(self.audio_array)))
-        other_padded = np.pad(other.audio_array, (0, max_len - len(other.audio_array)))
-        
-        # Mix with equal volume
-        mixed = (self_padded + other_padded) / 2
+        # Mix with equal volume, the shorter one padded with zeros
+        a, b = self.audio_array, other.audio_array
+        mixed = np.empty(max(len(a), len(b)), dtype=np.float32)
+        if HAVE_NUMBA:
+            from audio._kernels import overlay_kernel
+            
+            max_val = overlay_kernel(a, b, mixed)
+        else:
+            longer, shorter = (a, b) if len(a) >= len(b) else (b, a)
+            np.multiply(longer, np.float32(0.5), out=mixed)
+            mixed[:len(shorter)] += shorter * np.float32(0.5)
+            max_val = float(np.abs(mixed).max()) if len(mixed) else 0.0
         
         # Normalize to avoid clipping
-        max_val = np.max(np.abs(mixed))
         if max_val > 1.0:
-            mixed = mixed / max_val * 0.95
+            mixed *= np.float32(0.95 / max_val)
         
         return AudioSegment(mixed, self.sample_rate)
     
-    def export(self, filepath: str, format: str = 'wav'):
-        """Export audio to file."""
-        # Convert to int16
-        audio_int16 = np.clip(self.audio_array * 32767, -32768, 32767).astype(np.int16)
-        wavfile.write(filepath, self.sample_rate, audio_int16)
+    def export(self, filepath, format: str = 'wav'):
+        """Export audio to a file path or writable binary file object."""
+        # libsndfile clips and converts float -> 16-bit PCM in C; the format is
+        # passed explicitly since a file object has no extension to go by
+        sf.write(filepath, self.audio_array, self.sample_rate, format=format.upper(), subtype='PCM_16')
 
 
 class SoundGenerator:
@@ -75,6 +146,11 @@ class SoundGenerator:
         'channels': 1,
         'base_frequency': 440,  # A4 note
         'amplitude': 0.8,
+        # Approximate sine; disable for clean spectra. Only the NumPy path
+        # evaluates sin per sample - the Numba kernels use an exact oscillator
+        # recurrence, so this option has no effect when Numba is installed
+        'fast_math': True,
+        'seed': None,  # Noise RNG seed; set for reproducible output
     }
     
     # Sound themes configuration
@@ -101,6 +177,31 @@ class SoundGenerator:
         }
     }
     
+    # Per-theme voices: for each sound type, the sine partials as
+    # (base_frequency multiplier, amplitude) plus a white-noise amplitude
+    THEME_VOICES = {
+        'sine': {
+            'dot': (((1.0, 0.6),), 0.0),
+            'dash': (((0.8, 0.6),), 0.0),  # Lower frequency for dashes
+        },
+        'rain': {
+            'dot': (((2.0, 0.4),), 0.2),
+            'dash': (((1.5, 0.5),), 0.25),
+        },
+        'birds': {
+            'dot': (((3.0, 0.7),), 0.0),
+            'dash': (((2.5, 0.5), (2.75, 0.4)), 0.0),  # Warble effect
+        },
+        'synth': {
+            'dot': (((1.0, 0.5), (2.0, 0.3)), 0.0),  # Fundamental + harmonic
+            'dash': (((0.6, 0.5), (1.2, 0.3)), 0.0),
+        },
+        'digital': {
+            'dot': (((1.5, 0.7),), 0.0),
+            'dash': (((1.0, 0.7),), 0.0),
+        },
+    }
+    
     def __init__(self, config: dict = None):
         """
         Initialize the sound generator.
@@ -112,8 +213,32 @@ class SoundGenerator:
         if config:
             self.config.update(config)
         
-        self.current_theme = 'sine'
-        self.sample_rate = self.config['sample_rate']
+        # Hot config values as plain attributes (no dict lookup per sound)
+        self.sample_rate = int(self.config['sample_rate'])
+        self._base_freq = float(self.config['base_frequency'])
+        self._fast_math = bool(self.config['fast_math'])
+        
+        # Theme -> sound generator, resolved once per set_theme rather than
+        # per generated segment
+        self._theme_fns = {
+            'sine': self._generate_sine_sound,
+            'rain': self._generate_rain_sound,
+            'birds': self._generate_bird_sound,
+            'synth': self._generate_synth_sound,
+            'digital': self._generate_digital_sound,
+        }
+        self.set_theme('sine')
+        
+        self._rng = np.random.default_rng(self.config.get('seed'))
+        
+        # Silence is all the same samples: hand out read-only slices of one
+        # shared buffer (10 s) instead of allocating zeros for every gap
+        self._zero = np.zeros(self.sample_rate * 10, dtype=np.float32)
+        self._zero.flags.writeable = False
+        
+        # Dots and dashes repeat throughout a message, so their tonal parts
+        # are synthesized once per (theme, sound_type, n_samples)
+        self._tone_template = functools.lru_cache(maxsize=64)(self._synthesize_tone)
     
     def set_theme(self, theme: str):
         """
@@ -125,25 +250,50 @@ class SoundGenerator:
         if theme not in self.THEMES:
             raise ValueError(f"Unknown theme: {theme}. Available: {list(self.THEMES.keys())}")
         self.current_theme = theme
+        self._active_fn = self._theme_fns[theme]
     
-    def get_available_themes(self) -> list:
+    @classmethod
+    def get_available_themes(cls) -> list:
         """
         Get list of available sound themes.
         
         Returns:
             list: Available theme names
         """
-        return list(self.THEMES.keys())
+        return list(cls.THEMES.keys())
     
     def _generate_sine_wave(self, frequency: float, duration_sec: float, amplitude: float = 0.8) -> np.ndarray:
         """Generate a sine wave."""
-        t = np.linspace(0, duration_sec, int(self.sample_rate * duration_sec), False)
-        return amplitude * np.sin(2 * np.pi * frequency * t)
+        return self._sine_samples(frequency, int(self.sample_rate * duration_sec), amplitude)
+    
+    def _sine_samples(self, frequency: float, n: int, amplitude: float) -> np.ndarray:
+        """Generate n samples of a sine wave starting at phase 0."""
+        # One buffer, transformed in place: sample index -> phase -> sine -> scaled
+        buf = np.arange(n, dtype=np.float32)
+        buf *= np.float32(2 * np.pi * frequency / self.sample_rate)
+        self._sin(buf)
+        buf *= np.float32(amplitude)
+        return buf
+    
+    def _sin(self, phase: np.ndarray) -> np.ndarray:
+        """Take the sine of phase in place, approximated when fast_math is on (NumPy path only)."""
+        if self._fast_math:
+            return _fast_sin(phase)
+        return np.sin(phase, out=phase)
     
     def _generate_noise(self, duration_sec: float, amplitude: float = 0.8) -> np.ndarray:
         """Generate white noise."""
         samples = int(self.sample_rate * duration_sec)
-        return amplitude * np.random.randn(samples)
+        if HAVE_NUMBA:
+            from audio._kernels import fill_noise
+            
+            buf = np.empty(samples, dtype=np.float32)
+            fill_noise(buf, amplitude, self._rng.integers(2**31))
+            return buf
+        buf = np.empty(samples, dtype=np.float32)
+        self._rng.standard_normal(dtype=np.float32, out=buf)
+        buf *= np.float32(amplitude)
+        return buf
     
     def generate_sound_segment(self, duration: float, sound_type: str = 'dot') -> AudioSegment:
         """
@@ -156,77 +306,69 @@ class SoundGenerator:
         Returns:
             AudioSegment: Generated audio segment
         """
-        if self.current_theme == 'sine':
-            audio = self._generate_sine_sound(duration, sound_type)
-        elif self.current_theme == 'rain':
-            audio = self._generate_rain_sound(duration, sound_type)
-        elif self.current_theme == 'birds':
-            audio = self._generate_bird_sound(duration, sound_type)
-        elif self.current_theme == 'synth':
-            audio = self._generate_synth_sound(duration, sound_type)
-        elif self.current_theme == 'digital':
-            audio = self._generate_digital_sound(duration, sound_type)
+        return AudioSegment(self._active_fn(duration, sound_type), self.sample_rate)
+    
+    def _generate_voice(self, theme: str, duration_sec: float, sound_type: str) -> np.ndarray:
+        """Generate one sound from a theme's voice table."""
+        tone = self._tone_template(theme, sound_type, int(self.sample_rate * duration_sec))
+        
+        # Noise is fresh for every sound; only the tone is reused
+        noise_amp = self.THEME_VOICES[theme][sound_type][1]
+        if noise_amp:
+            audio = self._generate_noise(duration_sec, noise_amp)
+            audio += tone
+            return audio
+        return tone.copy()
+    
+    def _synthesize_tone(self, theme: str, sound_type: str, n: int) -> np.ndarray:
+        """
+        Synthesize the noise-free part of a sound as a read-only array.
+        
+        Called through the per-instance _tone_template cache.
+        """
+        if HAVE_NUMBA:
+            tone = np.empty(n, dtype=np.float32)
+            self._fill_voice(tone, theme, sound_type)
         else:
-            audio = self._generate_sine_sound(duration, sound_type)
+            partials = self.THEME_VOICES[theme][sound_type][0]
+            base_freq = self._base_freq
+            
+            tone = self._sine_samples(base_freq * partials[0][0], n, partials[0][1])
+            for multiplier, amplitude in partials[1:]:
+                tone += self._sine_samples(base_freq * multiplier, n, amplitude)
+        
+        tone.flags.writeable = False
+        return tone
+    
+    def _fill_voice(self, buf: np.ndarray, theme: str, sound_type: str):
+        """Fill buf with the tonal part of one sound using the compiled kernel (requires Numba)."""
+        # Imported here, not at module level, so commands that never render
+        # audio do not import Numba
+        from audio._kernels import fill_tone
         
-        return AudioSegment(audio, self.sample_rate)
+        partials = np.array(self.THEME_VOICES[theme][sound_type][0], dtype=np.float64)
+        radians_per_sample = 2 * np.pi * self._base_freq / self.sample_rate
+        fill_tone(buf, partials[:, 0] * radians_per_sample, partials[:, 1])
     
     def _generate_sine_sound(self, duration_sec: float, sound_type: str) -> np.ndarray:
         """Generate sine wave sound."""
-        if sound_type == 'dot':
-            freq = self.config['base_frequency']
-            amplitude = 0.6
-        else:  # dash
-            freq = self.config['base_frequency'] * 0.8  # Lower frequency for dashes
-            amplitude = 0.6
-        
-        return self._generate_sine_wave(freq, duration_sec, amplitude)
+        return self._generate_voice('sine', duration_sec, sound_type)
     
     def _generate_rain_sound(self, duration_sec: float, sound_type: str) -> np.ndarray:
         """Generate raindrop-like sound."""
-        if sound_type == 'dot':
-            freq = self.config['base_frequency'] * 2
-            tone = self._generate_sine_wave(freq, duration_sec, 0.4)
-            noise = self._generate_noise(duration_sec, 0.2)
-        else:
-            freq = self.config['base_frequency'] * 1.5
-            tone = self._generate_sine_wave(freq, duration_sec, 0.5)
-            noise = self._generate_noise(duration_sec, 0.25)
-        
-        return tone + noise
+        return self._generate_voice('rain', duration_sec, sound_type)
     
     def _generate_bird_sound(self, duration_sec: float, sound_type: str) -> np.ndarray:
         """Generate bird chirp-like sound."""
-        if sound_type == 'dot':
-            freq = self.config['base_frequency'] * 3
-            return self._generate_sine_wave(freq, duration_sec, 0.7)
-        else:
-            base_freq = self.config['base_frequency'] * 2.5
-            # Create warble effect
-            tone1 = self._generate_sine_wave(base_freq, duration_sec, 0.5)
-            tone2 = self._generate_sine_wave(base_freq * 1.1, duration_sec, 0.4)
-            return tone1 + tone2
+        return self._generate_voice('birds', duration_sec, sound_type)
     
     def _generate_synth_sound(self, duration_sec: float, sound_type: str) -> np.ndarray:
         """Generate electronic synth sound."""
-        if sound_type == 'dot':
-            freq = self.config['base_frequency']
-        else:
-            freq = self.config['base_frequency'] * 0.6
-        
-        # Add harmonics
-        fundamental = self._generate_sine_wave(freq, duration_sec, 0.5)
-        harmonic = self._generate_sine_wave(freq * 2, duration_sec, 0.3)
-        return fundamental + harmonic
+        return self._generate_voice('synth', duration_sec, sound_type)
     
     def _generate_digital_sound(self, duration_sec: float, sound_type: str) -> np.ndarray:
         """Generate digital beep sound."""
-        if sound_type == 'dot':
-            freq = self.config['base_frequency'] * 1.5
-        else:
-            freq = self.config['base_frequency']
-        
-        return self._generate_sine_wave(freq, duration_sec, 0.7)
+        return self._generate_voice('digital', duration_sec, sound_type)
     
     def generate_silence(self, duration: float) -> AudioSegment:
         """
@@ -236,10 +378,12 @@ class SoundGenerator:
             duration (float): Duration in seconds
             
         Returns:
-            AudioSegment: Silence segment
+            AudioSegment: Silence segment (read-only for gaps up to 10 s)
         """
-        silence = np.zeros(int(self.sample_rate * duration))
-        return AudioSegment(silence, self.sample_rate)
+        n = int(self.sample_rate * duration)
+        if n <= self._zero.size:
+            return AudioSegment(self._zero[:n], self.sample_rate)
+        return AudioSegment(np.zeros(n, dtype=np.float32), self.sample_rate)
     
     def timing_to_audio(self, timings: List[Tuple[float, float]]) -> AudioSegment:
         """
@@ -251,44 +395,115 @@ class SoundGenerator:
         Returns:
             AudioSegment: Combined audio file
         """
-        audio_segments = []
-        
-        for i, (duration, gap) in enumerate(timings):
-            # Generate sound for signal duration (if any)
-            if duration > 0:
-                # Determine if this is likely a dot or dash based on duration
-                dot_max = 0.3  # 300ms
-                if duration <= dot_max:
-                    sound_segment = self.generate_sound_segment(duration, 'dot')
-                else:
-                    sound_segment = self.generate_sound_segment(duration, 'dash')
-                audio_segments.append(sound_segment)
-            
-            # Add gap after signal
-            if gap > 0:
-                silence_segment = self.generate_silence(gap)
-                audio_segments.append(silence_segment)
-        
-        # Combine all segments
-        if not audio_segments:
+        out, _ = self._render_timings(timings)
+        if out.size == 0:
             return self.generate_silence(1.0)  # 1 second silence if empty
+        return AudioSegment(out, self.sample_rate)
+    
+    def _render_timings(self, timings: List[Tuple[float, float]],
+                        start_phases: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Synthesize a run of (duration, gap) pairs into one float32 buffer.
         
-        combined_audio = audio_segments[0]
-        for segment in audio_segments[1:]:
-            combined_audio = combined_audio + segment
-        
-        return combined_audio
+        Args:
+            timings: (duration, gap) pairs in seconds
+            start_phases: Oscillator phase per partial to continue from, or
+                None to start at zero
+                
+        Returns:
+            Tuple of the samples and the phases to pass in for the next run
+        """
+        # Sample counts per signal/gap, matching int(sample_rate * seconds)
+        # used by the generators
+        sr = self.sample_rate
+        n_sig = np.array([int(sr * d) if d > 0 else 0 for d, _ in timings], dtype=np.int64)
+        n_gap = np.array([int(sr * g) if g > 0 else 0 for _, g in timings], dtype=np.int64)
+        total = int(n_sig.sum() + n_gap.sum())
+        
+        dot_max = 0.3  # 300ms; longer signals are dashes
+        kind = np.array([d > dot_max for d, _ in timings], dtype=np.intp)
+        
+        # Lookup tables indexed by sound type (0 = dot, 1 = dash), with
+        # partials padded to a common count using zero amplitude
+        voices = self.THEME_VOICES.get(self.current_theme, self.THEME_VOICES['sine'])
+        dot, dash = voices['dot'], voices['dash']
+        n_partials = max(len(dot[0]), len(dash[0]))
+        pad = ((0.0, 0.0),) * n_partials
+        mults = np.array([(dot[0] + pad)[:n_partials], (dash[0] + pad)[:n_partials]])
+        noise_amps = np.array([dot[1], dash[1]])
+        
+        # Per-signal (n_signals, n_partials) frequencies and amplitudes
+        sig_freqs = self._base_freq * mults[kind, :, 0]
+        sig_amps = mults[kind, :, 1]
+        
+        # One oscillator per partial over the whole run: each signal starts
+        # at the phase the previous signals left off at, so tone onsets
+        # don't click. Gaps are silent and don't advance the phase.
+        if start_phases is None:
+            start_phases = np.zeros(n_partials)
+        sig_turns = sig_freqs * (2 * np.pi / sr) * n_sig[:, None]
+        end_phases = start_phases + sig_turns.sum(axis=0)
+        
+        out = np.zeros(total, dtype=np.float32)
+        if HAVE_NUMBA:
+            from audio._kernels import synthesize_all
+            
+            sig_offsets = np.cumsum(n_sig + n_gap) - (n_sig + n_gap)
+            sig_phases = start_phases + np.cumsum(sig_turns, axis=0) - sig_turns
+            synthesize_all(out, sig_offsets, n_sig, sig_freqs, sig_amps, sig_phases, sr)
+        else:
+            self._synthesize_vectorized(out, n_sig, n_gap, sig_freqs, sig_amps, start_phases)
+        
+        # Segments alternate signal, gap, signal, gap, ...
+        seg_lens = np.column_stack((n_sig, n_gap)).ravel()
+        seg_noise = np.zeros(len(seg_lens), dtype=np.float32)
+        seg_noise[0::2] = noise_amps[kind]
+        if seg_noise.any():
+            noise = self._rng.standard_normal(total, dtype=np.float32)
+            noise *= np.repeat(seg_noise, seg_lens)
+            out += noise
+        
+        return out, end_phases
+    
+    def _synthesize_vectorized(self, out: np.ndarray, n_sig: np.ndarray, n_gap: np.ndarray,
+                               sig_freqs: np.ndarray, sig_amps: np.ndarray, start_phases: np.ndarray):
+        """
+        Add every signal's partials into out with one np.sin pass per partial.
+        
+        NumPy fallback for synthesize_all: frequency and amplitude are
+        expanded per sample (zero during gaps) and the phase is their
+        running sum. The phase accumulates in float64, since float32 would
+        drift audibly over a long message.
+        """
+        seg_lens = np.column_stack((n_sig, n_gap)).ravel()
+        for k in range(sig_freqs.shape[1]):
+            if not sig_amps[:, k].any():
+                continue
+            seg_freqs = np.zeros(len(seg_lens))
+            seg_amps = np.zeros(len(seg_lens))
+            seg_freqs[0::2] = sig_freqs[:, k]
+            seg_amps[0::2] = sig_amps[:, k]
+            
+            phase_step = np.repeat(seg_freqs * (2 * np.pi / self.sample_rate), seg_lens)
+            phase = np.cumsum(phase_step)
+            phase -= phase_step  # Each segment's first sample starts at the accumulated phase
+            phase += start_phases[k]
+            self._sin(phase)
+            phase *= np.repeat(seg_amps, seg_lens)
+            out += phase
     
-    def save_audio(self, audio: AudioSegment, filepath: str):
+    def save_audio(self, audio: AudioSegment, filepath):
         """
         Save audio to file.
         
         Args:
             audio (AudioSegment): Audio to save
-            filepath (str): Output file path
+            filepath: Output file path, or a writable binary file object
+                (e.g. io.BytesIO)
         """
         # Ensure directory exists
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(filepath, (str, os.PathLike)):
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         
         # Export as WAV
         audio.export(filepath, format='wav')
@@ -304,290 +519,62 @@ class SoundGenerator:
         audio = self.timing_to_audio(timings)
         self.save_audio(audio, filepath)
         return audio
-
-
-# Example usage and testing
-if __name__ == "__main__":
-    from binary_encoder import BinaryEncoder
-    from utils.morse_code import MorseCode
-    
-    # Create instances
-    morse = MorseCode()
-    encoder = BinaryEncoder()
-    sound_gen = SoundGenerator()
-    
-    # Test message
-    test_message = "SOS"
-    
-    print("Sound Generator Test")
-    print("=" * 50)
-    print(f"Testing with message: '{test_message}'")
-    print(f"Available themes: {sound_gen.get_available_themes()}")
-    print()
-    
-    try:
-        # Convert to timing patterns
-        morse_code = morse.text_to_morse(test_message)
-        binary_data = encoder.morse_to_binary(morse_code)
-        timings = encoder.binary_to_timing(binary_data)
-        
-        print(f"Morse: {morse_code}")
-        print(f"Binary: {binary_data}")
-        print(f"Timing patterns: {len(timings)}")
-        print()
-        
-        # Test each theme
-        for theme in sound_gen.get_available_themes():
-            sound_gen.set_theme(theme)
-            output_file = f"test_output_{theme}.wav"
-            
-            # Generate audio
-            audio = sound_gen.generate_from_timing_and_save(timings, output_file)
-            
-            print(f"Theme: {theme:8} | Duration: {len(audio)/1000:.2f}s | File: {output_file}")
-            
-        print()
-        print("All test files generated successfully!")
-        print("Play the generated WAV files to hear the different sound themes.")
-        
-    except Exception as e:
-        print(f"Error during sound generation: {e}")
-    """
-    Generates audio from timing patterns with configurable sound themes.
-    """
-    
-    # Audio configuration
-    DEFAULT_CONFIG = {
-        'sample_rate': 44100,
-        'bit_depth': 16,
-        'channels': 1,
-        'base_frequency': 440,  # A4 note
-        'amplitude': 0.8,
-    }
-    
-    # Sound themes configuration
-    THEMES = {
-        'sine': {
-            'description': 'Clean sine wave tones',
-            'color': 'blue'
-        },
-        'rain': {
-            'description': 'Raindrop-like sounds', 
-            'color': 'gray'
-        },
-        'birds': {
-            'description': 'Bird chirp sounds',
-            'color': 'green'
-        },
-        'synth': {
-            'description': 'Electronic synth tones',
-            'color': 'purple'
-        },
-        'digital': {
-            'description': 'Digital beep sounds',
-            'color': 'orange'
-        }
-    }
-    
-    def __init__(self, config: dict = None):
-        """
-        Initialize the sound generator.
-        
-        Args:
-            config (dict, optional): Audio configuration parameters
-        """
-        self.config = self.DEFAULT_CONFIG.copy()
-        if config:
-            self.config.update(config)
-        
-        self.current_theme = 'sine'
-    
-    def set_theme(self, theme: str):
-        """
-        Set the current sound theme.
-        
-        Args:
-            theme (str): Theme name ('sine', 'rain', 'birds', 'synth', 'digital')
-        """
-        if theme not in self.THEMES:
-            raise ValueError(f"Unknown theme: {theme}. Available: {list(self.THEMES.keys())}")
-        self.current_theme = theme
-    
-    def get_available_themes(self) -> list:
-        """
-        Get list of available sound themes.
-        
-        Returns:
-            list: Available theme names
-        """
-        return list(self.THEMES.keys())
-    
-    
-    def generate_sound_segment(self, duration: float, sound_type: str = 'dot') -> AudioSegment:
-        """
-        Generate a single sound segment based on current theme and sound type.
-        
-        Args:
-            duration (float): Duration in seconds
-            sound_type (str): Type of sound ('dot' or 'dash')
-            
-        Returns:
-            AudioSegment: Generated audio segment
-        """
-        if self.current_theme == 'sine':
-            audio = self._generate_sine_sound(duration, sound_type)
-        elif self.current_theme == 'rain':
-            audio = self._generate_rain_sound(duration, sound_type)
-        elif self.current_theme == 'birds':
-            audio = self._generate_bird_sound(duration, sound_type)
-        elif self.current_theme == 'synth':
-            audio = self._generate_synth_sound(duration, sound_type)
-        elif self.current_theme == 'digital':
-            audio = self._generate_digital_sound(duration, sound_type)
-        else:
-            audio = self._generate_sine_sound(duration, sound_type)
-        
-        return AudioSegment(audio, self.sample_rate)
-    
-    
-    def _generate_sine_sound(self, duration_sec: float, sound_type: str) -> np.ndarray:
-        """Generate sine wave sound."""
-        if sound_type == 'dot':
-            freq = self.config['base_frequency']
-            amplitude = 0.6
-        else:  # dash
-            freq = self.config['base_frequency'] * 0.8  # Lower frequency for dashes
-            amplitude = 0.6
-        
-        return self._generate_sine_wave(freq, duration_sec, amplitude)
-    
-    def _generate_rain_sound(self, duration_sec: float, sound_type: str) -> np.ndarray:
-        """Generate raindrop-like sound."""
-        if sound_type == 'dot':
-            freq = self.config['base_frequency'] * 2
-            tone = self._generate_sine_wave(freq, duration_sec, 0.4)
-            noise = self._generate_noise(duration_sec, 0.2)
-        else:
-            freq = self.config['base_frequency'] * 1.5
-            tone = self._generate_sine_wave(freq, duration_sec, 0.5)
-            noise = self._generate_noise(duration_sec, 0.25)
-        
-        return tone + noise
-    
-    def _generate_bird_sound(self, duration_sec: float, sound_type: str) -> np.ndarray:
-        """Generate bird chirp-like sound."""
-        if sound_type == 'dot':
-            freq = self.config['base_frequency'] * 3
-            return self._generate_sine_wave(freq, duration_sec, 0.7)
-        else:
-            base_freq = self.config['base_frequency'] * 2.5
-            # Create warble effect
-            tone1 = self._generate_sine_wave(base_freq, duration_sec, 0.5)
-            tone2 = self._generate_sine_wave(base_freq * 1.1, duration_sec, 0.4)
-            return tone1 + tone2
-    
-    def _generate_synth_sound(self, duration_sec: float, sound_type: str) -> np.ndarray:
-        """Generate electronic synth sound."""
-        if sound_type == 'dot':
-            freq = self.config['base_frequency']
-        else:
-            freq = self.config['base_frequency'] * 0.6
-        
-        # Add harmonics
-        fundamental = self._generate_sine_wave(freq, duration_sec, 0.5)
-        harmonic = self._generate_sine_wave(freq * 2, duration_sec, 0.3)
-        return fundamental + harmonic
-    
-    def _generate_digital_sound(self, duration_sec: float, sound_type: str) -> np.ndarray:
-        """Generate digital beep sound."""
-        if sound_type == 'dot':
-            freq = self.config['base_frequency'] * 1.5
-        else:
-            freq = self.config['base_frequency']
-        
-        return self._generate_sine_wave(freq, duration_sec, 0.7)
     
-    
-    def generate_silence(self, duration: float) -> AudioSegment:
+    def generate_from_timing_and_save_streaming(self, timings: Iterable[Tuple[float, float]], filepath: str,
+                                                block_size: int = 64) -> float:
         """
-        Generate silence segment.
+        Generate audio from timing patterns, writing it to a WAV file as it goes.
         
-        Args:
-            duration (float): Duration in seconds
-            
-        Returns:
-            AudioSegment: Silence segment
-        """
-        silence = np.zeros(int(self.sample_rate * duration))
-        return AudioSegment(silence, self.sample_rate)
-    
-    def timing_to_audio(self, timings: List[Tuple[float, float]]) -> AudioSegment:
-        """
-        Convert timing patterns to audio segments.
+        Synthesizes block_size timings at a time and streams each block to
+        libsndfile (16-bit PCM), so peak memory is one block rather than the
+        whole message plus its int16 copy. The oscillator phase carries over
+        between blocks, so the audio matches timing_to_audio. timings may be
+        any iterable, including a generator, and is consumed block by block.
         
         Args:
-            timings (List[Tuple]): List of (duration, gap) pairs in seconds
+            timings (Iterable[Tuple]): Timing patterns
+            filepath (str): Output file path
+            block_size (int): Timings synthesized per write
             
         Returns:
-            AudioSegment: Combined audio file
+            float: Duration of the written audio in seconds
         """
-        audio_segments = []
-        
-        for i, (duration, gap) in enumerate(timings):
-            # Generate sound for signal duration (if any)
-            if duration > 0:
-                # Determine if this is likely a dot or dash based on duration
-                dot_max = 0.3  # 300ms
-                if duration <= dot_max:
-                    sound_segment = self.generate_sound_segment(duration, 'dot')
-                else:
-                    sound_segment = self.generate_sound_segment(duration, 'dash')
-                audio_segments.append(sound_segment)
-            
-            # Add gap after signal
-            if gap > 0:
-                silence_segment = self.generate_silence(gap)
-                audio_segments.append(silence_segment)
-        
-        # Combine all segments
-        if not audio_segments:
-            return self.generate_silence(1.0)  # 1 second silence if empty
-        
-        combined_audio = audio_segments[0]
-        for segment in audio_segments[1:]:
-            combined_audio = combined_audio + segment
-        
-        return combined_audio
-    
-    def save_audio(self, audio: AudioSegment, filepath: str):
-        """
-        Save audio to file.
-        
-        Args:
-            audio (AudioSegment): Audio to save
-            filepath (str): Output file path
-        """
-        # Ensure directory exists
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         
-        # Export as WAV
-        audio.export(filepath, format='wav')
-    
-    def generate_from_timing_and_save(self, timings: List[Tuple[float, float]], filepath: str):
-        """
-        Generate audio from timing patterns and save to file.
+        n_written = 0
+        phases = None
+        timings = iter(timings)
+        with sf.SoundFile(filepath, mode='w', samplerate=self.sample_rate, channels=1,
+                          subtype='PCM_16') as wav:
+            while True:
+                chunk = list(itertools.islice(timings, block_size))
+                if not chunk:
+                    break
+                block, phases = self._render_timings(chunk, phases)
+                wav.write(block)
+                n_written += block.size
+            
+            if n_written == 0:
+                silence = self.generate_silence(1.0).audio_array  # 1 second silence if empty
+                wav.write(silence)
+                n_written = silence.size
         
-        Args:
-            timings (List[Tuple]): Timing patterns
-            filepath (str): Output file path
-        """
-        audio = self.timing_to_audio(timings)
-        self.save_audio(audio, filepath)
-        return audio
+        return n_written / self.sample_rate
+
+
+def _render(theme: str, timings: List[Tuple[float, float]]) -> Tuple[str, int, str]:
+    """Render one theme's test file; a worker for the example below."""
+    sound_gen = SoundGenerator()
+    sound_gen.set_theme(theme)
+    output_file = f"test_output_{theme}.wav"
+    audio = sound_gen.generate_from_timing_and_save(timings, output_file)
+    return theme, len(audio), output_file
 
 
 # Example usage and testing
 if __name__ == "__main__":
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
     from binary_encoder import BinaryEncoder
     from utils.morse_code import MorseCode
     
@@ -616,15 +603,11 @@ if __name__ == "__main__":
         print(f"Timing patterns: {len(timings)}")
         print()
         
-        # Test each theme
-        for theme in sound_gen.get_available_themes():
-            sound_gen.set_theme(theme)
-            output_file = f"test_output_{theme}.wav"
-            
-            # Generate audio
-            audio = sound_gen.generate_from_timing_and_save(timings, output_file)
-            
-            print(f"Theme: {theme:8} | Duration: {len(audio)/1000:.2f}s | File: {output_file}")
+        # Test each theme; themes are independent, so render them in parallel
+        themes = sound_gen.get_available_themes()
+        with ProcessPoolExecutor(max_workers=len(themes)) as executor:
+            for theme, duration_ms, output_file in executor.map(_render, themes, repeat(timings)):
+                print(f"Theme: {theme:8} | Duration: {duration_ms/1000:.2f}s | File: {output_file}")
             
         print()
         print("All test files generated successfully!")
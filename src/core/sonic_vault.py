@@ -1,15 +1,12 @@
 
+import binascii
+import logging
 import os
 import sys
-import base64
+import time
 from pathlib import Path
 from typing import Tuple, Optional
-from datetime import datetime
 import warnings
-# In your sonic_vault.py imports section, ensure you have:
-from audio.audio_analyzer import AudioAnalyzer
-# Suppress pydub warnings
-warnings.filterwarnings("ignore", category=RuntimeWarning, module="pydub")
 
 # Ensure src is in path for imports
 _src_path = Path(__file__).parent.parent
@@ -20,15 +17,28 @@ from crypto.aes_manager import AESManager
 from crypto.dsa_manager import DSAManager
 from audio.binary_encoder import BinaryEncoder
 from audio.sound_generator import SoundGenerator
-from audio.audio_analyzer import AudioAnalyzer
 from utils.morse_code import MorseCode
 from utils.validation import validate_nonempty
 
+logger = logging.getLogger(__name__)
+
+def _configure_warnings():
+    """Silence pydub's RuntimeWarning about a missing ffmpeg (WAV needs none)."""
+    warnings.filterwarnings("ignore", category=RuntimeWarning, module="pydub")
+
 class SonicVault:
     """
     Main application class for SonicVault - Secure Audio Steganography.
     """
     
+    # Default file paths
+    default_private_key = "sonic_vault_private.pem"
+    default_public_key = "sonic_vault_public.pem"
+    
+    # Separates the encrypted hex payload from the hex signature; "Z" never
+    # occurs in hex, and both characters have a Morse encoding
+    SIGNATURE_SEPARATOR = "ZZ"
+    
     def __init__(self, config: dict = None):
         """
         Initialize SonicVault with all components.
@@ -37,6 +47,7 @@ class SonicVault:
             config (dict, optional): Configuration parameters
         """
         self.config = config or {}
+        _configure_warnings()
         
         # Initialize all components
         self.aes = AESManager()
@@ -44,10 +55,19 @@ class SonicVault:
         self.morse = MorseCode()
         self.encoder = BinaryEncoder()
         self.sound_gen = SoundGenerator()
+        self._analyzer = None
+    
+    @property
+    def analyzer(self):
+        """
+        The AudioAnalyzer used for decoding.
         
-        # Default file paths
-        self.default_private_key = "sonic_vault_private.pem"
-        self.default_public_key = "sonic_vault_public.pem"
+        Built on first use, so encoding never imports pydub.
+        """
+        if self._analyzer is None:
+            from audio.audio_analyzer import AudioAnalyzer
+            self._analyzer = AudioAnalyzer()
+        return self._analyzer
     
     def encode_message(self, message: str, password: str, output_file: str, 
                       theme: str = "sine", sign: bool = True, 
@@ -55,40 +75,39 @@ class SonicVault:
         """
         Encode a secure message into an audio file.
         """
-        print("🔐 SonicVault - Encoding Secure Message")
-        print("=" * 50)
-        print(f"📝 Message: '{message}'")
-        print(f"🎯 Output: {output_file}")
-        print(f"🎵 Theme: {theme}")
-        print(f"📝 Signed: {sign}")
-        print()
+        logger.info("🔐 SonicVault - Encoding Secure Message")
         
         # Validate inputs
         validate_nonempty(message, "message")
         validate_nonempty(password, "password")
         validate_nonempty(output_file, "output_file")
         
+        logger.info("📝 Message: %d characters", len(message))
+        logger.info("🎯 Output: %s", output_file)
+        logger.info("🎵 Theme: %s", theme)
+        logger.info("📝 Signed: %s", sign)
+        
         # Set sound theme
         if theme not in self.sound_gen.get_available_themes():
             raise ValueError(f"Invalid theme: {theme}. Available: {self.sound_gen.get_available_themes()}")
         self.sound_gen.set_theme(theme)
         
         # Step 1: Encrypt the message
-        print("🔄 Step 1/5: Encrypting message with AES-256...")
+        logger.info("🔄 Step 1/5: Encrypting message with AES-256...")
         encrypted_data = self.aes.encrypt_to_string(message, password)
-        print(f"   ✅ Encrypted data: {len(encrypted_data)} bytes")
+        logger.info("   ✅ Encrypted data: %d bytes", len(encrypted_data))
         
         # Step 2: Add digital signature if requested
         if sign:
-            print("🔄 Step 2/5: Adding digital signature with DSA-2048...")
+            logger.info("🔄 Step 2/5: Adding digital signature with Ed25519...")
             if private_key_path and os.path.exists(private_key_path):
                 # Load existing private key
                 with open(private_key_path, 'rb') as f:
                     private_key = self.dsa.private_key_from_bytes(f.read())
-                print(f"   ✅ Loaded existing private key: {private_key_path}")
+                logger.info("   ✅ Loaded existing private key: %s", private_key_path)
             else:
                 # Generate new key pair
-                print("   🔑 Generating new DSA key pair...")
+                logger.info("   🔑 Generating new Ed25519 key pair...")
                 private_key, public_key = self.dsa.generate_keypair()
                 
                 # Save keys
@@ -96,59 +115,55 @@ class SonicVault:
                 public_key_path = private_key_path.replace('_private.pem', '_public.pem') if '_private.pem' in private_key_path else self.default_public_key
                 
                 self.dsa.save_keypair(private_key, public_key, private_key_path, public_key_path)
-                print(f"   💾 New keys saved: {private_key_path}, {public_key_path}")
+                logger.info("   💾 New keys saved: %s, %s", private_key_path, public_key_path)
             
             # Sign the encrypted data
             signature = self.dsa.sign_data(encrypted_data.encode('utf-8'), private_key)
-            signed_data = encrypted_data + "|SIG|" + base64.b64encode(signature).decode('utf-8')
-            print(f"   ✅ Signature added: {len(signature)} bytes")
+            signed_data = encrypted_data + self.SIGNATURE_SEPARATOR + signature.hex().upper()
+            logger.info("   ✅ Signature added: %d bytes", len(signature))
         else:
             signed_data = encrypted_data
-            print("   ⚠️  Skipping digital signature")
+            logger.info("   ⚠️  Skipping digital signature")
         
         # Step 3: Convert to Morse code
-        print("🔄 Step 3/5: Converting to Morse code...")
-        payload_hex = signed_data.encode('utf-8').hex().upper()
-        morse_code = self.morse.text_to_morse(payload_hex)
-        print(f"   ✅ Morse code: {len(morse_code.split())} elements")
+        logger.info("🔄 Step 3/5: Converting to Morse code...")
+        # The payload is already hex, which is what the Morse layer carries
+        morse_code = self.morse.text_to_morse(signed_data)
+        logger.info("   ✅ Morse code: %d elements", morse_code.count(' ') + 1)
         
         # Step 4: Convert to binary with timing patterns
-        print("🔄 Step 4/5: Converting to binary timing patterns...")
+        logger.info("🔄 Step 4/5: Converting to binary timing patterns...")
         binary_data = self.encoder.morse_to_binary(morse_code)
         timings = self.encoder.binary_to_timing(binary_data)
-        print(f"   ✅ Binary data: {len(binary_data)} bits")
-        print(f"   ✅ Timing patterns: {len(timings)} segments")
+        logger.info("   ✅ Binary data: %d bits", len(binary_data))
+        logger.info("   ✅ Timing patterns: %d segments", len(timings))
         
-        # Step 5: Generate audio file
-        print("🔄 Step 5/5: Generating audio file...")
-        audio = self.sound_gen.timing_to_audio(timings)
-        self.sound_gen.save_audio(audio, output_file)
-        print(f"   ✅ Audio file created: {len(audio)/1000:.2f} seconds")
+        # Step 5: Generate audio file, streamed to disk block by block so the
+        # whole message is never held in memory as samples
+        logger.info("🔄 Step 5/5: Generating audio file...")
+        duration = self.sound_gen.generate_from_timing_and_save_streaming(timings, output_file)
+        logger.info("   ✅ Audio file created: %.2f seconds", duration)
         
         # Return results
-        print("\n" + "=" * 50)
-        print("✅ ENCODING COMPLETE!")
-        print("=" * 50)
+        logger.info("✅ ENCODING COMPLETE!")
         return {
             'success': True,
             'output_file': output_file,
             'message_length': len(message),
             'encrypted_length': len(encrypted_data),
-            'audio_duration_seconds': len(audio) / 1000.0,
+            'audio_duration_seconds': duration,
             'theme': theme,
             'signed': sign,
             'private_key_path': private_key_path if sign else None,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time()
         }
     
     def decode_message(self, audio_file: str, password: str, public_key_path: str = None) -> dict:
         """
         Decode a message from an audio file.
         """
-        print("🔐 SonicVault - Decoding Secure Message")
-        print("=" * 50)
-        print(f"🎵 Input: {audio_file}")
-        print()
+        logger.info("🔐 SonicVault - Decoding Secure Message")
+        logger.info("🎵 Input: %s", audio_file)
         
         # Validate inputs
         validate_nonempty(audio_file, "audio_file")
@@ -158,92 +173,90 @@ class SonicVault:
             raise FileNotFoundError(f"Audio file not found: {audio_file}")
         
         # Step 1: Analyze audio to extract timing patterns
-        print("🔄 Step 1/6: Analyzing audio file...")
-        analyzer = AudioAnalyzer()
+        logger.info("🔄 Step 1/6: Analyzing audio file...")
         try:
             # BUG FIX 1: Use improved timing pattern detection with better threshold
-            timings = analyzer.analyze_timing_patterns_robust(audio_file)
+            timings = self.analyzer.analyze_timing_patterns_robust(audio_file)
             if not timings:
                 # Fallback to simple method if robust method fails
-                timings = analyzer.analyze_timing_patterns_simple(audio_file)
+                timings = self.analyzer.analyze_timing_patterns_simple(audio_file)
             
-            print(f"   📊 Analyzed {len(timings)} valid timing patterns")
+            logger.info("   📊 Analyzed %d valid timing patterns", len(timings))
             
             # BUG FIX 2: Validate we have enough timing patterns
             if len(timings) < 10:
                 raise ValueError(f"Insufficient timing patterns detected: {len(timings)}")
                 
         except Exception as e:
-            print(f"   ❌ Audio analysis failed: {e}")
+            logger.warning("   ❌ Audio analysis failed: %s", e)
             return {
                 'success': False,
                 'message': f"Audio analysis failed: {e}",
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.time()
             }
         
         # Step 2: Convert timing patterns to binary
-        print("🔄 Step 2/6: Converting timing patterns to binary...")
+        logger.info("🔄 Step 2/6: Converting timing patterns to binary...")
         try:
             binary_data = self.encoder.timing_to_binary(timings)
-            print(f"   ✅ Binary data: {len(binary_data)} bits")
+            logger.info("   ✅ Binary data: %d bits", len(binary_data))
             
             # BUG FIX 3: Validate binary data length
             if len(binary_data) < 20:
                 raise ValueError(f"Binary data too short: {len(binary_data)} bits")
                 
         except Exception as e:
-            print(f"   ❌ Binary conversion failed: {e}")
+            logger.warning("   ❌ Binary conversion failed: %s", e)
             return {
                 'success': False,
                 'message': f"Binary conversion failed: {e}",
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.time()
             }
         
         # Step 3: Convert binary to Morse code
-        print("🔄 Step 3/6: Converting binary to Morse code...")
+        logger.info("🔄 Step 3/6: Converting binary to Morse code...")
         try:
             morse_code = self.encoder.binary_to_morse(binary_data)
-            print(f"   ✅ Morse code extracted: {len(morse_code)} characters")
+            logger.info("   ✅ Morse code extracted: %d characters", len(morse_code))
             
             # BUG FIX 4: Validate Morse code
             if len(morse_code) < 10:
                 raise ValueError(f"Morse code too short: {len(morse_code)} chars")
                 
         except Exception as e:
-            print(f"   ❌ Morse conversion failed: {e}")
+            logger.warning("   ❌ Morse conversion failed: %s", e)
             return {
                 'success': False,
                 'message': f"Morse conversion failed: {e}",
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.time()
             }
         
         # Step 4: Convert Morse code to text
-        print("🔄 Step 4/6: Converting Morse code to text...")
+        logger.info("🔄 Step 4/6: Converting Morse code to text...")
         try:
             # Use error-resilient Morse decoding
-            extracted_hex = self.morse.morse_to_text(morse_code, skip_errors=True)
-            if len(extracted_hex) < 2:
-                print(f"   ⚠️  Warning: Extracted data seems short: {len(extracted_hex)} chars")
-            extracted_bytes = bytes.fromhex(extracted_hex)
-            extracted_data = extracted_bytes.decode('utf-8')
-            print(f"   ✅ Extracted data: {len(extracted_data)} characters")
+            extracted_data = self.morse.morse_to_text(morse_code, skip_errors=True)
+            if len(extracted_data) < 2:
+                logger.warning("   ⚠️  Warning: Extracted data seems short: %d chars", len(extracted_data))
+            logger.info("   ✅ Extracted data: %d characters", len(extracted_data))
 
         except Exception as e:
-            print(f"   ❌ Text conversion failed: {e}")
+            logger.warning("   ❌ Text conversion failed: %s", e)
             return {
                 'success': False,
                 'message': f"Text conversion failed: {e}",
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.time()
             }
         # Step 5: Handle signature and decryption
         signature_valid = None
         encrypted_data = extracted_data
         
-        if "|SIG|" in extracted_data:
-            print("🔄 Step 5/6: Verifying digital signature...")
+        if self.SIGNATURE_SEPARATOR in extracted_data:
+            logger.info("🔄 Step 5/6: Verifying digital signature...")
             try:
-                encrypted_data, signature_b64 = extracted_data.split("|SIG|")
-                signature = base64.b64decode(signature_b64)
+                # One scan for the separator; no intermediate list
+                encrypted_data, _, signature_hex = extracted_data.partition(self.SIGNATURE_SEPARATOR)
+                signature = binascii.unhexlify(signature_hex)
                 
                 # Verify signature
                 if public_key_path and os.path.exists(public_key_path):
@@ -256,21 +269,21 @@ class SonicVault:
                         public_key
                     )
                     status = "✅ VALID" if signature_valid else "❌ INVALID"
-                    print(f"   {status} Digital signature verified")
+                    logger.info("   %s Digital signature verified", status)
                 else:
                     signature_valid = False
-                    print("   ⚠️  No public key provided for signature verification")
+                    logger.warning("   ⚠️  No public key provided for signature verification")
                     
             except Exception as e:
-                print(f"   ❌ Signature verification failed: {e}")
+                logger.warning("   ❌ Signature verification failed: %s", e)
                 signature_valid = False
         else:
             encrypted_data = extracted_data
             signature_valid = None
-            print("   ℹ️  No signature found in message")
+            logger.info("   ℹ️  No signature found in message")
         
         # Step 6: Decrypt the message
-        print("🔄 Step 6/6: Decrypting message...")
+        logger.info("🔄 Step 6/6: Decrypting message...")
         try:
             # BUG FIX 6: Add validation before decryption
             if not encrypted_data or len(encrypted_data) < 16:
@@ -278,29 +291,26 @@ class SonicVault:
                 
             decrypted_message = self.aes.decrypt_from_string(encrypted_data, password)
             decryption_success = True
-            print("   ✅ Decryption successful!")
+            logger.info("   ✅ Decryption successful!")
             
         except ValueError as e:
             decrypted_message = f"Decryption failed: {e}"
             decryption_success = False
-            print(f"   ❌ Decryption failed: {e}")
+            logger.warning("   ❌ Decryption failed: %s", e)
         except Exception as e:
             decrypted_message = f"Unexpected error during decryption: {e}"
             decryption_success = False
-            print(f"   ❌ Decryption error: {e}")
+            logger.warning("   ❌ Decryption error: %s", e)
         
         # Return results
-        print("\n" + "=" * 50)
         if decryption_success and (signature_valid is not False):
-            print("✅ DECODING SUCCESSFUL!")
-            print(f"💬 Original message: '{decrypted_message}'")
+            logger.info("✅ DECODING SUCCESSFUL!")
         else:
-            print("❌ DECODING FAILED!")
+            logger.warning("❌ DECODING FAILED!")
             if not decryption_success:
-                print(f"💬 Error: {decrypted_message}")
+                logger.warning("💬 Error: %s", decrypted_message)
             elif signature_valid is False:
-                print(f"💬 Error: Digital signature verification failed")
-        print("=" * 50)
+                logger.warning("💬 Error: Digital signature verification failed")
         
         return {
             'success': decryption_success and (signature_valid is not False),
@@ -309,13 +319,13 @@ class SonicVault:
             'timing_patterns_count': len(timings),
             'binary_data_length': len(binary_data),
             'extracted_data_length': len(extracted_data),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time()
         }
     
     def generate_keypair(self, private_key_path: str = None, public_key_path: str = None,
                         password: str = None) -> dict:
         """
-        Generate a new DSA key pair.
+        Generate a new Ed25519 key pair.
         
         Args:
             private_key_path (str): Path for private key file
@@ -325,7 +335,7 @@ class SonicVault:
         Returns:
             dict: Key generation results
         """
-        print("🔑 Generating DSA key pair...")
+        logger.info("🔑 Generating Ed25519 key pair...")
         private_key, public_key = self.dsa.generate_keypair()
         
         # Set default paths if not provided
@@ -339,18 +349,22 @@ class SonicVault:
             'success': True,
             'private_key_path': private_key_path,
             'public_key_path': public_key_path,
-            'key_size': 2048,
-            'timestamp': datetime.now().isoformat()
+            'key_size': self.dsa.CONFIG['key_size'],
+            'timestamp': time.time()
         }
     
-    def get_audio_themes(self) -> list:
+    @classmethod
+    def get_audio_themes(cls) -> list:
         """
         Get available audio themes.
         
+        Static data, so this can be called on the class without building
+        the crypto/audio components.
+        
         Returns:
             list: Available theme names
         """
-        return self.sound_gen.get_available_themes()
+        return SoundGenerator.get_available_themes()
     
     def validate_password(self, password: str) -> Tuple[bool, str]:
         """
@@ -364,24 +378,33 @@ class SonicVault:
         """
         return self.aes.validate_password_strength(password)
     
-    def get_system_info(self) -> dict:
+    @classmethod
+    def get_system_info(cls) -> dict:
         """
         Get system information and capabilities.
         
+        Like get_audio_themes, this needs no instance.
+        
         Returns:
             dict: System information
         """
+        aes_backend = AESManager.aes_backend()
+        if aes_backend == 'software':
+            logger.warning("No AES instructions detected: encryption uses OpenSSL's "
+                           "software AES, which is slower and exposed to cache-timing attacks")
+        
         return {
             'version': '1.0.0',
             'components': {
-                'aes_encryption': 'AES-256-CBC with PBKDF2',
-                'dsa_signatures': 'DSA-2048 with SHA-256',
-                'audio_themes': self.get_audio_themes(),
-                'morse_support': len(self.morse.get_supported_characters()),
+                'aes_encryption': 'AES-256-GCM with PBKDF2',
+                'aes_backend': aes_backend,
+                'dsa_signatures': 'Ed25519',
+                'audio_themes': cls.get_audio_themes(),
+                'morse_support': len(MorseCode.get_supported_characters()),
             },
             'default_key_paths': {
-                'private_key': self.default_private_key,
-                'public_key': self.default_public_key,
+                'private_key': cls.default_private_key,
+                'public_key': cls.default_public_key,
             }
         }
     
@@ -397,6 +420,7 @@ class SonicVault:
 
 # Example usage and testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     vault = SonicVault()
     
     print("SonicVault - Secure Audio Steganography")
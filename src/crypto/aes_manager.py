@@ -4,13 +4,67 @@ Handles AES-256 encryption and decryption of messages.
 """
 
 import os
-import base64
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives import padding, hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
-from typing import Tuple
-import secrets
+import binascii
+from collections import OrderedDict
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from typing import List, Tuple
+import threading
+
+from crypto.key_derivation import derive_key, derive_key_argon2id, fast_mac, HAVE_ARGON2
+
+class _RandomPool:
+    """
+    Buffer of os.urandom output handed out in small pieces.
+    
+    Refilling 4 KiB at a time makes salts and IVs cost one getrandom call
+    per ~100 encryptions instead of two per encryption. Forked children
+    start with an empty buffer, so parent and child never reuse bytes.
+    """
+    
+    def __init__(self, size: int = 4096):
+        self._size = size
+        self._reset()
+    
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._buf = b''
+        self._pos = 0
+    
+    def get(self, n: int) -> bytes:
+        """Return n fresh random bytes."""
+        with self._lock:
+            if self._pos + n > len(self._buf):
+                self._buf = os.urandom(max(self._size, n))
+                self._pos = 0
+            out = self._buf[self._pos:self._pos + n]
+            self._pos += n
+            return out
+
+_POOL = _RandomPool()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_POOL._reset)
+
+# CPU flags relevant to AES-GCM: x86 (aes, vaes, pclmulqdq, vpclmulqdq,
+# sha_ni) and ARMv8 (aes, pmull, sha2)
+_CRYPTO_FLAGS = frozenset({'aes', 'vaes', 'pclmulqdq', 'vpclmulqdq', 'sha_ni', 'pmull', 'sha2'})
+
+def _detect_hw_features():
+    """
+    Read the CPU's crypto extension flags from /proc/cpuinfo.
+    
+    Returns:
+        frozenset or None: The flags present, or None where they cannot be
+        read (non-Linux platforms)
+    """
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key.strip() in ('flags', 'Features'):
+                    return frozenset(value.split()) & _CRYPTO_FLAGS
+    except OSError:
+        pass
+    return None
 
 class AESManager:
     """
@@ -21,52 +75,109 @@ class AESManager:
     CONFIG = {
         'key_length': 32,      # 256 bits for AES-256
         'salt_length': 16,     # 128 bits for salt
-        'iv_length': 16,       # 128 bits for IV
+        'iv_length': 12,       # 96-bit GCM nonce
+        'tag_length': 16,      # 128-bit GCM authentication tag
+        'kdf': 'pbkdf2',       # 'pbkdf2' or 'argon2id' (needs argon2-cffi)
         'iterations': 100000,  # PBKDF2 iterations
+        'argon2_time_cost': 3,
+        'argon2_memory_cost': 65536,  # KiB
+        'argon2_parallelism': 4,
+        'key_cache_size': 32,  # Derived keys kept per manager
     }
     
-    def __init__(self):
-        """Initialize the AES encryption manager."""
-        self.backend = default_backend()
+    # CPU crypto extensions detected at import (None if unknown)
+    HW_FEATURES = _detect_hw_features()
+    
+    def __init__(self, kdf: str = None):
+        """
+        Initialize the AES encryption manager.
+        
+        Args:
+            kdf (str, optional): Key derivation function, 'pbkdf2' or
+                'argon2id'; defaults to CONFIG['kdf']
+        """
+        self.kdf = kdf or self.CONFIG['kdf']
+        if self.kdf not in ('pbkdf2', 'argon2id'):
+            raise ValueError(f"Unknown KDF: {self.kdf}")
+        if self.kdf == 'argon2id' and not HAVE_ARGON2:
+            raise ImportError("The argon2id KDF requires argon2-cffi (pip install sonic-vault[argon2])")
+        
+        # LRU of derived keys keyed by (SHA-256 of password, salt), so
+        # repeated work with the same password and salt skips PBKDF2
+        self._key_cache = OrderedDict()
+    
+    @classmethod
+    def aes_backend(cls) -> str:
+        """
+        Describe the AES implementation OpenSSL will dispatch to on this CPU.
+        
+        Returns:
+            str: 'AES-NI+VAES', 'AES-NI', 'software' or 'unknown'
+        """
+        if cls.HW_FEATURES is None:
+            return 'unknown'
+        if 'aes' not in cls.HW_FEATURES:
+            return 'software'
+        return 'AES-NI+VAES' if 'vaes' in cls.HW_FEATURES else 'AES-NI'
     
     def encrypt(self, plaintext: str, password: str) -> Tuple[bytes, bytes, bytes]:
         """
-        Encrypt plaintext using AES-256-CBC with PBKDF2 key derivation.
+        Encrypt plaintext using AES-256-GCM with PBKDF2 key derivation.
         
         Args:
             plaintext (str): Text to encrypt
             password (str): Password for key derivation
             
         Returns:
-            Tuple[bytes, bytes, bytes]: (salt, iv, ciphertext)
+            Tuple[bytes, bytes, bytes]: (salt, iv, ciphertext with the GCM tag appended)
         """
         # Generate random salt and IV
-        salt = secrets.token_bytes(self.CONFIG['salt_length'])
-        iv = secrets.token_bytes(self.CONFIG['iv_length'])
+        salt = _POOL.get(self.CONFIG['salt_length'])
+        iv = _POOL.get(self.CONFIG['iv_length'])
         
         # Derive key from password
         key = self._derive_key(password, salt)
         
-        # Pad the plaintext
-        padder = padding.PKCS7(128).padder()
-        padded_data = padder.update(plaintext.encode('utf-8'))
-        padded_data += padder.finalize()
-        
-        # Encrypt
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=self.backend)
-        encryptor = cipher.encryptor()
-        ciphertext = encryptor.update(padded_data) + encryptor.finalize()
+        # Encrypt (GCM is a stream mode: no padding) and authenticate. GCM is
+        # CTR plus GHASH, so OpenSSL runs it through its parallel AES-NI/VAES
+        # and PCLMUL/VPCLMUL code paths; no separate HMAC pass is needed.
+        # AESGCM does the whole operation in one call and appends the tag
+        ciphertext = AESGCM(key).encrypt(iv, plaintext.encode('utf-8'), None)
         
         return salt, iv, ciphertext
     
+    def encrypt_many(self, plaintexts: List[str], password: str) -> List[Tuple[bytes, bytes, bytes]]:
+        """
+        Encrypt several plaintexts under one password with a single key derivation.
+        
+        All results share one salt (and so one key); each gets its own random
+        IV, which is all GCM needs to stay secure.
+        
+        Args:
+            plaintexts (List[str]): Texts to encrypt
+            password (str): Password for key derivation
+            
+        Returns:
+            List[Tuple[bytes, bytes, bytes]]: (salt, iv, ciphertext) per plaintext,
+            each decryptable with decrypt()
+        """
+        salt = _POOL.get(self.CONFIG['salt_length'])
+        aesgcm = AESGCM(self._derive_key(password, salt))
+        
+        results = []
+        for plaintext in plaintexts:
+            iv = _POOL.get(self.CONFIG['iv_length'])
+            results.append((salt, iv, aesgcm.encrypt(iv, plaintext.encode('utf-8'), None)))
+        return results
+    
     def decrypt(self, salt: bytes, iv: bytes, ciphertext: bytes, password: str) -> str:
         """
-        Decrypt ciphertext using AES-256-CBC.
+        Decrypt and authenticate ciphertext using AES-256-GCM.
         
         Args:
             salt (bytes): Salt used for key derivation
             iv (bytes): Initialization vector
-            ciphertext (bytes): Encrypted data
+            ciphertext (bytes): Encrypted data with the GCM tag appended
             password (str): Password for key derivation
             
         Returns:
@@ -79,15 +190,11 @@ class AESManager:
             # Derive key from password
             key = self._derive_key(password, salt)
             
-            # Decrypt
-            cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=self.backend)
-            decryptor = cipher.decryptor()
-            padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+            if len(ciphertext) < self.CONFIG['tag_length']:
+                raise ValueError("Ciphertext too short")
             
-            # Unpad
-            unpadder = padding.PKCS7(128).unpadder()
-            plaintext = unpadder.update(padded_plaintext)
-            plaintext += unpadder.finalize()
+            # Decrypt; raises InvalidTag if the appended tag doesn't verify
+            plaintext = AESGCM(key).decrypt(iv, ciphertext, None)
             
             return plaintext.decode('utf-8')
         
@@ -96,47 +203,62 @@ class AESManager:
     
     def encrypt_to_string(self, plaintext: str, password: str) -> str:
         """
-        Encrypt plaintext and return as a single base64 string.
+        Encrypt plaintext and return as a single hex string.
         
         Args:
             plaintext (str): Text to encrypt
             password (str): Password for key derivation
             
         Returns:
-            str: Base64 encoded string containing salt, iv, and ciphertext
+            str: Uppercase hex string containing salt, iv, and ciphertext
         """
         salt, iv, ciphertext = self.encrypt(plaintext, password)
         
         # Combine all components
         combined = salt + iv + ciphertext
         
-        # Encode as base64 for easy storage/transmission
-        return base64.b64encode(combined).decode('utf-8')
+        # Hex is what the Morse layer carries, so encode once, here. bytes.hex
+        # works straight from the raw bytes and measures faster than
+        # binascii.hexlify/b16encode plus a decode to str
+        return combined.hex().upper()
     
     def decrypt_from_string(self, encrypted_data: str, password: str) -> str:
         """
-        Decrypt from a single base64 string.
+        Decrypt from a single hex string.
         
         Args:
-            encrypted_data (str): Base64 string containing salt, iv, and ciphertext
+            encrypted_data (str): Hex string containing salt, iv, and ciphertext
             password (str): Password for key derivation
             
         Returns:
             str: Decrypted plaintext
         """
-        # Decode base64
-        combined = base64.b64decode(encrypted_data)
+        # unhexlify is faster than bytes.fromhex (it does not look for
+        # whitespace); its binascii.Error is a ValueError like other failures
+        return self.decrypt_from_bytes(binascii.unhexlify(encrypted_data), password)
+    
+    def decrypt_from_bytes(self, combined: bytes, password: str) -> str:
+        """
+        Decrypt from raw salt + iv + ciphertext bytes.
         
-        # Extract components
-        salt = combined[:self.CONFIG['salt_length']]
-        iv = combined[self.CONFIG['salt_length']:self.CONFIG['salt_length'] + self.CONFIG['iv_length']]
-        ciphertext = combined[self.CONFIG['salt_length'] + self.CONFIG['iv_length']:]
+        Args:
+            combined (bytes): Salt, iv, and ciphertext concatenated
+            password (str): Password for key derivation
+            
+        Returns:
+            str: Decrypted plaintext
+        """
+        # Slice through a memoryview so the ciphertext is not copied; the
+        # salt is copied since it is part of the key cache's dict key
+        view = memoryview(combined)
+        iv_start = self.CONFIG['salt_length']
+        ct_start = iv_start + self.CONFIG['iv_length']
         
-        return self.decrypt(salt, iv, ciphertext, password)
+        return self.decrypt(bytes(view[:iv_start]), view[iv_start:ct_start], view[ct_start:], password)
     
     def _derive_key(self, password: str, salt: bytes) -> bytes:
         """
-        Derive encryption key from password using PBKDF2.
+        Derive encryption key from password using PBKDF2 (or Argon2id).
         
         Args:
             password (str): User password
@@ -145,14 +267,29 @@ class AESManager:
         Returns:
             bytes: Derived key
         """
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=self.CONFIG['key_length'],
-            salt=salt,
-            iterations=self.CONFIG['iterations'],
-            backend=self.backend
-        )
-        return kdf.derive(password.encode('utf-8'))
+        # Salt-keyed tag of the password, so the plaintext is never stored
+        cache_key = fast_mac(salt, password.encode('utf-8'))
+        key = self._key_cache.get(cache_key)
+        if key is not None:
+            self._key_cache.move_to_end(cache_key)
+            return key
+        
+        if self.kdf == 'argon2id':
+            key = derive_key_argon2id(
+                password,
+                salt,
+                time_cost=self.CONFIG['argon2_time_cost'],
+                memory_cost=self.CONFIG['argon2_memory_cost'],
+                parallelism=self.CONFIG['argon2_parallelism'],
+                length=self.CONFIG['key_length'],
+            )
+        else:
+            key = derive_key(password, salt, self.CONFIG['iterations'], self.CONFIG['key_length'])
+        
+        self._key_cache[cache_key] = key
+        if len(self._key_cache) > self.CONFIG['key_cache_size']:
+            self._key_cache.popitem(last=False)
+        return key
     
     def validate_password_strength(self, password: str) -> Tuple[bool, str]:
         """
@@ -170,11 +307,21 @@ class AESManager:
         if len(password) > 128:
             return False, "Password must be less than 128 characters"
         
-        # Check for character variety
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(not c.isalnum() for c in password)
+        # Check for character variety in one pass, stopping once all four
+        # classes have been seen
+        has_upper = has_lower = has_digit = has_special = False
+        for c in password:
+            # Independent checks: a character can be both cased and special
+            if c.isupper():
+                has_upper = True
+            if c.islower():
+                has_lower = True
+            if c.isdigit():
+                has_digit = True
+            if not c.isalnum():
+                has_special = True
+            if has_upper and has_lower and has_digit and has_special:
+                break
         
         score = sum([has_upper, has_lower, has_digit, has_special])
         
@@ -1,126 +1,242 @@
 """
 DSA Signature Manager for SonicVault
-Handles DSA key generation, signing, and verification.
+Handles Ed25519 key generation, signing, and verification.
 """
 
-import os
-import base64
+import hashlib
+from collections import OrderedDict
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import dsa
+from cryptography.hazmat.primitives.asymmetric import dsa, ed25519
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.backends import default_backend
 from cryptography.exceptions import InvalidSignature
-from typing import Tuple
-import secrets
+from typing import List, Tuple, Union
+
+from utils.file_utils import read_bytes, write_bytes_atomic
+
+# Loaded keys are Ed25519, or DSA for key files written before the switch
+PrivateKey = Union[ed25519.Ed25519PrivateKey, dsa.DSAPrivateKey]
+PublicKey = Union[ed25519.Ed25519PublicKey, dsa.DSAPublicKey]
 
 
 class DSAManager:
     """
-    Handles DSA key generation, signing, and verification.
+    Handles Ed25519 key generation, signing, and verification.
+    
+    Keys were DSA-2048 before; loaded DSA keys still sign and verify.
     """
     
-    # DSA configuration
+    __slots__ = ('backend', '_pem_cache', '_key_cache')
+    
+    # Hash for legacy DSA keys, bound once so sign/verify skip the CONFIG lookup
+    _HASH = hashes.SHA256()
+    _PREHASHED = Prehashed(_HASH)
+    
+    # Signature configuration
     CONFIG = {
-        'key_size': 2048,      # 2048-bit DSA keys
-        'hash_algorithm': hashes.SHA256(),
+        'key_size': 256,       # Ed25519 keys (32 bytes)
+        'signature_size': 64,  # Ed25519 signatures are a fixed 64 bytes
+        'hash_algorithm': _HASH,  # Only used for legacy DSA keys
+        'cache_size': 16,      # Serialized/parsed keys kept per manager
     }
     
     def __init__(self):
         """Initialize the DSA signature manager."""
         self.backend = default_backend()
+        
+        # LRUs of PEM encodings and parsed keys, so saving or loading the same
+        # key again skips the ASN.1 work (and the KDF for encrypted keys).
+        # Encodings are keyed by id(key) and store the key itself, which keeps
+        # it alive and lets a lookup confirm the id was not reused
+        self._pem_cache = OrderedDict()
+        self._key_cache = OrderedDict()
+    
+    def _cache_get(self, cache: OrderedDict, cache_key):
+        """Return the cached value for cache_key (or None), marking it recent."""
+        value = cache.get(cache_key)
+        if value is not None:
+            cache.move_to_end(cache_key)
+        return value
+    
+    def _cache_put(self, cache: OrderedDict, cache_key, value):
+        """Store value under cache_key, evicting the least recent entry if full."""
+        cache[cache_key] = value
+        if len(cache) > self.CONFIG['cache_size']:
+            cache.popitem(last=False)
+    
+    @staticmethod
+    def _password_digest(password: str) -> bytes:
+        """Cache-key form of a password, so the plaintext is never stored."""
+        return hashlib.sha256(password.encode('utf-8')).digest() if password else b''
     
-    def generate_keypair(self) -> Tuple[dsa.DSAPrivateKey, dsa.DSAPublicKey]:
+    def generate_keypair(self) -> Tuple[ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey]:
         """
-        Generate a new DSA key pair.
+        Generate a new Ed25519 key pair.
         
         Returns:
-            Tuple[dsa.DSAPrivateKey, dsa.DSAPublicKey]: Private and public keys
+            Tuple[ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey]: Private and public keys
         """
-        private_key = dsa.generate_private_key(
-            key_size=self.CONFIG['key_size'],
-            backend=self.backend
-        )
+        private_key = ed25519.Ed25519PrivateKey.generate()
         public_key = private_key.public_key()
         
         return private_key, public_key
     
-    def sign_data(self, data: bytes, private_key: dsa.DSAPrivateKey) -> bytes:
+    def sign_data(self, data: bytes, private_key: ed25519.Ed25519PrivateKey) -> bytes:
         """
-        Sign data using DSA private key.
+        Sign data using an Ed25519 (or legacy DSA) private key.
         
         Args:
             data (bytes): Data to sign
-            private_key (dsa.DSAPrivateKey): Private key for signing
+            private_key (ed25519.Ed25519PrivateKey): Private key for signing
             
         Returns:
             bytes: Digital signature
         """
-        signature = private_key.sign(
-            data,
-            self.CONFIG['hash_algorithm']
-        )
-        return signature
+        if isinstance(private_key, dsa.DSAPrivateKey):
+            return private_key.sign(data, self._HASH)
+        # Ed25519 hashes internally (SHA-512); no hash argument
+        return private_key.sign(data)
     
-    def verify_signature(self, data: bytes, signature: bytes, public_key: dsa.DSAPublicKey) -> bool:
+    def verify_signature(self, data: bytes, signature: bytes,
+                         public_key: ed25519.Ed25519PublicKey) -> bool:
         """
-        Verify DSA signature.
+        Verify an Ed25519 (or legacy DSA) signature.
         
         Args:
             data (bytes): Original data
             signature (bytes): Signature to verify
-            public_key (dsa.DSAPublicKey): Public key for verification
+            public_key (ed25519.Ed25519PublicKey): Public key for verification
             
         Returns:
             bool: True if signature is valid, False otherwise
         """
         try:
-            public_key.verify(
-                signature,
-                data,
-                self.CONFIG['hash_algorithm']
-            )
+            if isinstance(public_key, dsa.DSAPublicKey):
+                public_key.verify(signature, data, self._HASH)
+            else:
+                public_key.verify(signature, data)
             return True
         except InvalidSignature:
             return False
     
-    def private_key_to_bytes(self, private_key: dsa.DSAPrivateKey, password: str = None) -> bytes:
+    def sign_prehashed(self, digest: bytes, private_key: dsa.DSAPrivateKey) -> bytes:
+        """
+        Sign a SHA-256 digest computed by the caller (legacy DSA keys only).
+        
+        Lets a large payload that is already hashed be signed without a
+        second pass over it. Pure Ed25519 signs the message itself and has
+        no prehashed mode, so Ed25519 keys are rejected.
+        
+        Args:
+            digest (bytes): hashlib.sha256(data).digest()
+            private_key (dsa.DSAPrivateKey): Legacy DSA private key
+            
+        Returns:
+            bytes: Digital signature, verifiable with verify_signature(data, ...)
+        """
+        if not isinstance(private_key, dsa.DSAPrivateKey):
+            raise ValueError("Prehashed signing requires a legacy DSA key; "
+                             "Ed25519 signs the full data")
+        return private_key.sign(digest, self._PREHASHED)
+    
+    def verify_prehashed(self, digest: bytes, signature: bytes,
+                         public_key: dsa.DSAPublicKey) -> bool:
+        """
+        Verify a legacy DSA signature against a caller-computed SHA-256 digest.
+        
+        Args:
+            digest (bytes): hashlib.sha256(data).digest()
+            signature (bytes): Signature to verify
+            public_key (dsa.DSAPublicKey): Legacy DSA public key
+            
+        Returns:
+            bool: True if signature is valid, False otherwise
+        """
+        if not isinstance(public_key, dsa.DSAPublicKey):
+            raise ValueError("Prehashed verification requires a legacy DSA key; "
+                             "Ed25519 verifies the full data")
+        try:
+            public_key.verify(signature, digest, self._PREHASHED)
+            return True
+        except InvalidSignature:
+            return False
+    
+    def verify_signatures_batch(self, items: List[Tuple[bytes, bytes]], public_keys) -> List[bool]:
+        """
+        Verify many signatures in one call.
+        
+        Args:
+            items (List[Tuple[bytes, bytes]]): (data, signature) pairs
+            public_keys: One public key for every item, or a list with one
+                key per item
+            
+        Returns:
+            List[bool]: Verification result per item
+        """
+        if not isinstance(public_keys, (list, tuple)):
+            public_keys = [public_keys] * len(items)
+        if len(public_keys) != len(items):
+            raise ValueError("Need one public key per item")
+        
+        verify = self.verify_signature
+        return [verify(data, signature, public_key)
+                for (data, signature), public_key in zip(items, public_keys)]
+    
+    def private_key_to_bytes(self, private_key: ed25519.Ed25519PrivateKey,
+                             password: str = None) -> bytes:
         """
         Serialize private key to bytes.
         
         Args:
-            private_key (dsa.DSAPrivateKey): Private key to serialize
+            private_key (ed25519.Ed25519PrivateKey): Private key to serialize
             password (str, optional): Password for encryption
             
         Returns:
             bytes: Serialized private key
         """
+        cache_key = (id(private_key), self._password_digest(password))
+        cached = self._cache_get(self._pem_cache, cache_key)
+        if cached is not None and cached[0] is private_key:
+            return cached[1]
+        
         if password:
             encryption = serialization.BestAvailableEncryption(password.encode('utf-8'))
         else:
             encryption = serialization.NoEncryption()
         
-        return private_key.private_bytes(
+        pem = private_key.private_bytes(
             encoding=serialization.Encoding.PEM,
             format=serialization.PrivateFormat.PKCS8,
             encryption_algorithm=encryption
         )
+        self._cache_put(self._pem_cache, cache_key, (private_key, pem))
+        return pem
     
-    def public_key_to_bytes(self, public_key: dsa.DSAPublicKey) -> bytes:
+    def public_key_to_bytes(self, public_key: ed25519.Ed25519PublicKey) -> bytes:
         """
         Serialize public key to bytes.
         
         Args:
-            public_key (dsa.DSAPublicKey): Public key to serialize
+            public_key (ed25519.Ed25519PublicKey): Public key to serialize
             
         Returns:
             bytes: Serialized public key
         """
-        return public_key.public_bytes(
+        cache_key = (id(public_key), b'')
+        cached = self._cache_get(self._pem_cache, cache_key)
+        if cached is not None and cached[0] is public_key:
+            return cached[1]
+        
+        pem = public_key.public_bytes(
             encoding=serialization.Encoding.PEM,
             format=serialization.PublicFormat.SubjectPublicKeyInfo
         )
+        self._cache_put(self._pem_cache, cache_key, (public_key, pem))
+        return pem
     
-    def private_key_from_bytes(self, key_data: bytes, password: str = None) -> dsa.DSAPrivateKey:
+    def private_key_from_bytes(self, key_data: bytes,
+                               password: str = None) -> ed25519.Ed25519PrivateKey:
         """
         Load private key from bytes.
         
@@ -129,20 +245,28 @@ class DSAManager:
             password (str, optional): Password for decryption
             
         Returns:
-            dsa.DSAPrivateKey: Loaded private key
+            ed25519.Ed25519PrivateKey: Loaded private key
         """
+        cache_key = (hashlib.blake2b(key_data, digest_size=16).digest(),
+                     self._password_digest(password))
+        private_key = self._cache_get(self._key_cache, cache_key)
+        if private_key is not None:
+            return private_key
+        
         if password:
             password_bytes = password.encode('utf-8')
         else:
             password_bytes = None
         
-        return serialization.load_pem_private_key(
+        private_key = serialization.load_pem_private_key(
             key_data,
             password=password_bytes,
             backend=self.backend
         )
+        self._cache_put(self._key_cache, cache_key, private_key)
+        return private_key
     
-    def public_key_from_bytes(self, key_data: bytes) -> dsa.DSAPublicKey:
+    def public_key_from_bytes(self, key_data: bytes) -> ed25519.Ed25519PublicKey:
         """
         Load public key from bytes.
         
@@ -150,36 +274,45 @@ class DSAManager:
             key_data (bytes): Serialized public key
             
         Returns:
-            dsa.DSAPublicKey: Loaded public key
+            ed25519.Ed25519PublicKey: Loaded public key
         """
-        return serialization.load_pem_public_key(
+        # The b'public' tag keeps public and private entries apart
+        cache_key = (hashlib.blake2b(key_data, digest_size=16).digest(), b'public')
+        public_key = self._cache_get(self._key_cache, cache_key)
+        if public_key is not None:
+            return public_key
+        
+        public_key = serialization.load_pem_public_key(
             key_data,
             backend=self.backend
         )
+        self._cache_put(self._key_cache, cache_key, public_key)
+        return public_key
     
-    def save_keypair(self, private_key: dsa.DSAPrivateKey, public_key: dsa.DSAPublicKey, 
-                    private_path: str, public_path: str, password: str = None):
+    def save_keypair(self, private_key: ed25519.Ed25519PrivateKey,
+                     public_key: ed25519.Ed25519PublicKey,
+                     private_path: str, public_path: str, password: str = None):
         """
         Save key pair to files.
         
+        Each key is written to a temp file and renamed into place, so a crash
+        never leaves a truncated key.
+        
         Args:
-            private_key (dsa.DSAPrivateKey): Private key to save
-            public_key (dsa.DSAPublicKey): Public key to save
+            private_key (ed25519.Ed25519PrivateKey): Private key to save
+            public_key (ed25519.Ed25519PublicKey): Public key to save
             private_path (str): Path for private key file
             public_path (str): Path for public key file
             password (str, optional): Password for private key encryption
         """
         # Save private key
-        private_bytes = self.private_key_to_bytes(private_key, password)
-        with open(private_path, 'wb') as f:
-            f.write(private_bytes)
+        write_bytes_atomic(private_path, self.private_key_to_bytes(private_key, password))
         
         # Save public key
-        public_bytes = self.public_key_to_bytes(public_key)
-        with open(public_path, 'wb') as f:
-            f.write(public_bytes)
+        write_bytes_atomic(public_path, self.public_key_to_bytes(public_key))
     
-    def load_keypair(self, private_path: str, public_path: str, password: str = None) -> Tuple[dsa.DSAPrivateKey, dsa.DSAPublicKey]:
+    def load_keypair(self, private_path: str, public_path: str,
+                     password: str = None) -> Tuple[PrivateKey, PublicKey]:
         """
         Load key pair from files.
         
@@ -189,87 +322,125 @@ class DSAManager:
             password (str, optional): Password for private key decryption
             
         Returns:
-            Tuple[dsa.DSAPrivateKey, dsa.DSAPublicKey]: Loaded key pair
+            Tuple[PrivateKey, PublicKey]: Loaded key pair (Ed25519, or DSA for
+            legacy key files)
         """
         # Load private key
-        with open(private_path, 'rb') as f:
-            private_key = self.private_key_from_bytes(f.read(), password)
+        private_key = self.private_key_from_bytes(read_bytes(private_path), password)
         
         # Load public key
-        with open(public_path, 'rb') as f:
-            public_key = self.public_key_from_bytes(f.read())
+        public_key = self.public_key_from_bytes(read_bytes(public_path))
         
         return private_key, public_key
     
-    def sign_and_combine(self, data: bytes, private_key: dsa.DSAPrivateKey) -> bytes:
+    def sign_and_combine(self, data: bytes, private_key: ed25519.Ed25519PrivateKey) -> bytes:
         """
         Sign data and combine with original data.
         
         Args:
             data (bytes): Data to sign
-            private_key (dsa.DSAPrivateKey): Private key for signing
+            private_key (ed25519.Ed25519PrivateKey): Private key for signing
             
         Returns:
             bytes: Combined data + signature
         """
         signature = self.sign_data(data, private_key)
-
-        # Combine: data + signature + signature length (4 bytes)
-        # (Length placed at end so verify can read it from the final 4 bytes)
-        signature_length = len(signature).to_bytes(4, byteorder='big')
-        combined = data + signature + signature_length
         
-        return combined
+        if isinstance(private_key, dsa.DSAPrivateKey):
+            # Legacy DSA signatures vary in length: data + signature + signature
+            # length (4 bytes, at the end so verify can read it first)
+            return b''.join((data, signature, len(signature).to_bytes(4, byteorder='big')))
+        
+        # Ed25519 signatures are a fixed 64 bytes, so no length is stored.
+        # join sizes the result once instead of building intermediates
+        return b''.join((data, signature))
     
-    def verify_and_extract(self, combined_data: bytes, public_key: dsa.DSAPublicKey) -> Tuple[bytes, bool]:
+    def verify_and_extract(self, combined_data: bytes,
+                           public_key: ed25519.Ed25519PublicKey) -> Tuple[bytes, bool]:
         """
         Extract data and verify signature from combined data.
         
         Args:
             combined_data (bytes): Combined data + signature
-            public_key (dsa.DSAPublicKey): Public key for verification
+            public_key (ed25519.Ed25519PublicKey): Public key for verification
             
         Returns:
-            Tuple[bytes, bool]: (original_data, verification_result)
+            Tuple[bytes, bool]: (original_data, verification_result); the data
+            is b'' when the signature does not verify
         """
         try:
-            # Extract signature length
-            if len(combined_data) < 4:
-                return b'', False
-            
-            signature_length = int.from_bytes(combined_data[-4:], byteorder='big')
+            # Slice through a view so only verified data is ever copied out
+            view = memoryview(combined_data)
+            if isinstance(public_key, dsa.DSAPublicKey):
+                # Extract signature length
+                if len(view) < 4:
+                    return b'', False
+                
+                signature_length = int.from_bytes(view[-4:], byteorder='big')
+                trailer = 4
+            else:
+                signature_length = self.CONFIG['signature_size']
+                trailer = 0
             
             # Check if we have enough data
-            if len(combined_data) < 4 + signature_length:
+            if len(view) < trailer + signature_length:
                 return b'', False
             
             # Extract data and signature
-            data = combined_data[:-4 - signature_length]
-            signature = combined_data[-4 - signature_length:-4]
-            
-            # Verify signature
-            is_valid = self.verify_signature(data, signature, public_key)
+            end = len(view) - trailer
+            data = view[:end - signature_length]
+            signature = view[end - signature_length:end]
             
-            return data, is_valid
+            # Verify signature; unauthenticated data is not handed back
+            if not self.verify_signature(data, signature, public_key):
+                return b'', False
+            return data.tobytes(), True
             
         except Exception:
             return b'', False
+    
+    def public_key_to_raw(self, public_key: ed25519.Ed25519PublicKey) -> bytes:
+        """
+        Serialize an Ed25519 public key to its raw 32-byte form.
+        
+        Args:
+            public_key (ed25519.Ed25519PublicKey): Public key to serialize
+            
+        Returns:
+            bytes: Raw public key (32 bytes)
+        """
+        return public_key.public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw
+        )
+    
+    def public_key_from_raw(self, key_data: bytes) -> ed25519.Ed25519PublicKey:
+        """
+        Load an Ed25519 public key from its raw 32-byte form.
+        
+        Args:
+            key_data (bytes): Raw public key
+            
+        Returns:
+            ed25519.Ed25519PublicKey: Loaded public key
+        """
+        return ed25519.Ed25519PublicKey.from_public_bytes(key_data)
 
 
 # Example usage and testing
 if __name__ == "__main__":
     dsa_mgr = DSAManager()
     
-    print("DSA Signature Manager Test")
+    print("Signature Manager Test (Ed25519)")
     print("=" * 50)
     
     # Generate key pair
-    print("1. Generating DSA key pair...")
+    print("1. Generating Ed25519 key pair...")
     private_key, public_key = dsa_mgr.generate_keypair()
     print("   ✓ Key pair generated successfully")
     
     # Test data
-    test_data = b"Hello, SonicVault! This is a test message for DSA signatures."
+    test_data = b"Hello, SonicVault! This is a test message for Ed25519 signatures."
     
     # Sign data
     print("2. Signing test data...")
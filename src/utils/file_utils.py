@@ -1,8 +1,66 @@
 """File utility helpers."""
-from pathlib import Path
+import os
+import threading
+
+# Windows opens raw fds in text mode unless O_BINARY is passed; it does not
+# exist (and is not needed) elsewhere
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+
+
+def read_bytes(path: str) -> bytes:
+    # One open/fstat/read/close on the raw fd; key and payload files are
+    # small enough that the first read almost always returns everything
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 1 << 16))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+def _write_fd(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def write_bytes(path: str, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        _write_fd(fd, data)
+    finally:
+        os.close(fd)
+
+def write_bytes_atomic(path: str, data: bytes) -> None:
+    # Write a sibling temp file and rename it over path, so readers see
+    # either the old file or the complete new one, never a partial write
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o666)
+    try:
+        try:
+            _write_fd(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 def read_text(path: str) -> str:
-    return Path(path).read_text(encoding='utf-8')
+    # Universal newlines, as Path.read_text: \r\n and \r both read as \n
+    text = read_bytes(path).decode('utf-8')
+    return text.replace('\r\n', '\n').replace('\r', '\n')
 
 def write_text(path: str, content: str) -> None:
-    Path(path).write_text(content, encoding='utf-8')
+    # Newlines are written as os.linesep, as Path.write_text does
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    write_bytes(path, content.encode('utf-8'))
@@ -0,0 +1,33 @@
+"""Optional Numba JIT support.
+
+Numba is not a required dependency, and importing it takes a noticeable
+fraction of CLI startup, so this module only checks whether it is installed.
+``njit`` and ``prange`` are resolved on first access (PEP 562): Numba's when
+it is installed, otherwise ``njit`` returns the decorated function unchanged
+and ``prange`` is plain ``range``, so kernels written against this module
+still run (as ordinary Python). Import kernel modules only on the code paths
+that run them.
+"""
+
+import importlib.util
+
+HAVE_NUMBA = importlib.util.find_spec('numba') is not None
+
+
+def _njit_fallback(*args, **kwargs):
+    """No-op stand-in for numba.njit."""
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
+
+
+def __getattr__(name):
+    if name in ('njit', 'prange'):
+        if HAVE_NUMBA:
+            import numba
+            value = getattr(numba, name)
+        else:
+            value = _njit_fallback if name == 'njit' else range
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
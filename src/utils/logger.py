@@ -1,10 +1,14 @@
 """Logging configuration helper."""
 import logging
 
+_configured = False
+
 def get_logger(name=__name__):
-    logger = logging.getLogger(name)
-    if not logger.handlers:
-        ch = logging.StreamHandler()
-        ch.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
-        logger.addHandler(ch)
-    return logger
+    # Configure the root handler once instead of attaching one per logger;
+    # per-logger handlers emit each record twice when the root is set up too.
+    # basicConfig is a no-op if the application already configured logging
+    global _configured
+    if not _configured:
+        logging.basicConfig(format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        _configured = True
+    return logging.getLogger(name)
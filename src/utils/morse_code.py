@@ -2,13 +2,23 @@
 Morse Code utilities for SonicVault.
 """
 
+import logging
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
 class MorseCode:
     """
     Handles conversion between text and Morse code with error resilience.
     """
     
-    # International Morse code dictionary
-    MORSE_CODE_DICT = {
+    # All state is class-level tables; instances carry no __dict__
+    __slots__ = ()
+    
+    # International Morse code dictionary (read-only)
+    MORSE_CODE_DICT = MappingProxyType({
         'A': '.-',      'B': '-...',    'C': '-.-.',    'D': '-..',     'E': '.',      
         'F': '..-.',    'G': '--.',     'H': '....',    'I': '..',      'J': '.---',
         'K': '-.-',     'L': '.-..',    'M': '--',      'N': '-.',      'O': '---',
@@ -21,12 +31,23 @@ class MorseCode:
         ':': '---...',  ';': '-.-.-.',  '=': '-...-',   '+': '.-.-.',   '-': '-....-',
         '_': '..--.-',  '"': '.-..-.',  '$': '...-..-', '@': '.--.-.',  '|': '...-.-',
         ' ': '/'
-    }
+    })
     
-    # Reverse dictionary for decoding
-    REVERSE_DICT = {v: k for k, v in MORSE_CODE_DICT.items()}
+    # Reverse dictionary for decoding. The hot paths index the plain dict:
+    # lookups through a MappingProxyType measure ~10% slower
+    _DECODE = {v: k for k, v in MORSE_CODE_DICT.items()}
+    REVERSE_DICT = MappingProxyType(_DECODE)
     
-    def _normalize_text(self, text: str) -> str:
+    # str.translate table mapping each supported character (and lowercase
+    # letters) to its code plus the separating space, so encoding is one C call
+    _ENCODE_TABLE = str.maketrans({
+        **{k: v + ' ' for k, v in MORSE_CODE_DICT.items()},
+        **{k.lower(): v + ' ' for k, v in MORSE_CODE_DICT.items() if k.isalpha()},
+    })
+    _ENCODABLE = frozenset(map(chr, _ENCODE_TABLE))
+    
+    @staticmethod
+    def _normalize_text(text: str) -> str:
         """
         Normalize input text by uppercasing, trimming, and collapsing whitespace.
         """
@@ -38,14 +59,48 @@ class MorseCode:
             return ""
         return ' '.join(stripped.split())
 
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _normalize_and_check(cls, text: str) -> tuple:
+        """
+        Normalize text and report whether every character is encodable.
+        
+        Cached so validating and then encoding the same text scans it once;
+        the bound stays small because payloads can be large hex strings.
+        
+        Returns:
+            tuple: (normalized_text, is_valid)
+        """
+        normalized = cls._normalize_text(text)
+        if not normalized:
+            return normalized, False
+        # Fast path: every character has a direct table entry
+        if cls._ENCODABLE.issuperset(normalized):
+            return normalized, True
+        for char in normalized:
+            if char == ' ':
+                continue
+            lookup = char
+            if lookup not in cls.MORSE_CODE_DICT and char.isalpha():
+                lookup = char.upper()
+            if lookup not in cls.MORSE_CODE_DICT:
+                return normalized, False
+        return normalized, True
+
     def text_to_morse(self, text: str) -> str:
         """
         Convert text to Morse code.
         """
-        normalized = self._normalize_text(text)
+        normalized = self._normalize_and_check(text)[0]
         if not normalized:
             return ""
         
+        # Fast path: anything left besides Morse symbols was not in the table,
+        # so fall through to the per-character loop to resolve or report it
+        translated = normalized.translate(self._ENCODE_TABLE)
+        if not translated.strip('.-/ '):
+            return translated[:-1]
+        
         morse_parts = []
         for char in normalized:
             if char == ' ':
@@ -83,36 +138,52 @@ class MorseCode:
         words = [word.strip() for word in normalized.split('/') if word.strip()]
         
         for word in words:
-            chars = word.split(' ')
-            word_text = []
-            
-            for morse_char in chars:
-                if not morse_char:
-                    continue
-                    
-                morse_char = morse_char.strip()
-                
-                # Direct lookup
-                if morse_char in self.REVERSE_DICT:
-                    word_text.append(self.REVERSE_DICT[morse_char])
+            # Fast path: every token is a known code, so one split and a single
+            # itemgetter call (lookups done in C) decode the word; an empty or
+            # unknown token raises KeyError and the word goes token by token
+            codes = word.split(' ')
+            try:
+                if len(codes) > 1:
+                    word_text = itemgetter(*codes)(self._DECODE)
                 else:
-                    if skip_errors:
-                        # Try to recover by length-based guessing
-                        recovered = self._recover_morse_char(morse_char)
-                        if recovered:
-                            word_text.append(recovered)
-                            continue
-                        # Skip invalid sequences silently when skipping errors
-                        continue
-                    raise ValueError(f"Invalid Morse pattern: '{morse_char}'")
+                    word_text = self._DECODE[codes[0]]
+            except KeyError:
+                word_text = self._decode_word(word, skip_errors)
             
             if word_text:
                 text_parts.append(''.join(word_text))
         
         result = ' '.join(text_parts)
-        print(f"   📝 Morse Decoding: '{result}'")
+        logger.debug("Morse decoded: %r", result)
         return result
     
+    def _decode_word(self, word: str, skip_errors: bool) -> list:
+        """
+        Decode one Morse word token by token, recovering or rejecting
+        unknown codes.
+        """
+        word_text = []
+        for morse_char in word.split(' '):
+            if not morse_char:
+                continue
+                
+            morse_char = morse_char.strip()
+            
+            # Direct lookup
+            if morse_char in self._DECODE:
+                word_text.append(self._DECODE[morse_char])
+            else:
+                if skip_errors:
+                    # Try to recover by length-based guessing
+                    recovered = self._recover_morse_char(morse_char)
+                    if recovered:
+                        word_text.append(recovered)
+                        continue
+                    # Skip invalid sequences silently when skipping errors
+                    continue
+                raise ValueError(f"Invalid Morse pattern: '{morse_char}'")
+        return word_text
+    
     def _recover_morse_char(self, morse_char: str) -> str:
         """
         Attempt to recover corrupted Morse characters.
@@ -138,25 +209,15 @@ class MorseCode:
         # If all else fails, return empty string to skip
         return ''
 
-    def get_supported_characters(self) -> list:
+    @classmethod
+    def get_supported_characters(cls) -> list:
         """
         Get list of supported characters.
         """
-        return list(self.MORSE_CODE_DICT.keys())    
+        return list(cls.MORSE_CODE_DICT.keys())    
 
     def validate_text(self, text: str) -> bool:
         """
         Validate that text contains only supported characters and is non-empty.
         """
-        normalized = self._normalize_text(text)
-        if not normalized:
-            return False
-        for char in normalized:
-            if char == ' ':
-                continue
-            lookup = char
-            if lookup not in self.MORSE_CODE_DICT and char.isalpha():
-                lookup = char.upper()
-            if lookup not in self.MORSE_CODE_DICT:
-                return False
-        return True
\ No newline at end of file
+        return self._normalize_and_check(text)[1]
\ No newline at end of file
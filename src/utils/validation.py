@@ -1,7 +1,8 @@
 """Input validation helpers."""
 
 def is_nonempty_str(s) -> bool:
-    return isinstance(s, str) and bool(s.strip())
+    # isspace() scans in place instead of allocating a stripped copy
+    return isinstance(s, str) and bool(s) and not s.isspace()
 
 
 def validate_nonempty(value: str, field_name: str):
@@ -15,5 +16,5 @@ def validate_nonempty(value: str, field_name: str):
     Raises:
         ValueError: If value is empty
     """
-    if not value or not value.strip():
+    if not value or value.isspace():
         raise ValueError(f"{field_name} cannot be empty")
@@ -1 +1,21 @@
 # Fixtures package
+import io
+import os
+
+
+def assert_nonempty(testcase, target):
+    """
+    Assert that target holds data, without extra syscalls for in-memory targets.
+    
+    Args:
+        testcase (unittest.TestCase): Test case used for the assertion
+        target: bytes-like object, io.BytesIO, or a file path (one os.stat,
+            which also fails if the file is missing)
+    """
+    if isinstance(target, (bytes, bytearray, memoryview)):
+        size = len(target)
+    elif isinstance(target, io.BytesIO):
+        size = target.getbuffer().nbytes
+    else:
+        size = os.stat(target).st_size
+    testcase.assertGreater(size, 0)
@@ -8,14 +8,22 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../src'))
 
-from crypto.aes_manager import AESManager
+from crypto.aes_manager import AESManager, HAVE_ARGON2
+
+# Set to run the KDF at its production cost as well
+FULL_KDF = bool(os.environ.get('SONICVAULT_FULL_KDF'))
 
 class TestAESManager(unittest.TestCase):
     """Test cases for AESManager class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share one manager with a cheap KDF; these tests check correctness, not KDF strength."""
+        cls.aes = AESManager()
+        cls.aes.CONFIG = {**AESManager.CONFIG, 'iterations': 1000}
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.aes = AESManager()
         self.test_password = "TestPassword123!"
     
     def test_encrypt_decrypt_basic(self):
@@ -50,6 +58,25 @@ class TestAESManager(unittest.TestCase):
         decrypted = self.aes.decrypt_from_string(encrypted_string, self.test_password)
         self.assertEqual(plaintext, decrypted)
     
+    def test_decrypt_from_bytes(self):
+        """Test decryption from raw concatenated bytes."""
+        salt, iv, ciphertext = self.aes.encrypt("Raw bytes", self.test_password)
+        
+        decrypted = self.aes.decrypt_from_bytes(salt + iv + ciphertext, self.test_password)
+        self.assertEqual(decrypted, "Raw bytes")
+    
+    def test_encrypt_many(self):
+        """Test batch encryption with a shared key derivation."""
+        plaintexts = ["first", "second", ""]
+        results = self.aes.encrypt_many(plaintexts, self.test_password)
+        
+        self.assertEqual(len(results), len(plaintexts))
+        # One salt for the batch, a fresh IV per message
+        self.assertEqual(len({salt for salt, _, _ in results}), 1)
+        self.assertEqual(len({iv for _, iv, _ in results}), len(plaintexts))
+        for plaintext, (salt, iv, ciphertext) in zip(plaintexts, results):
+            self.assertEqual(self.aes.decrypt(salt, iv, ciphertext, self.test_password), plaintext)
+    
     def test_different_messages_produce_different_ciphertexts(self):
         """Test that same message produces different ciphertexts each time."""
         plaintext = "Same message"
@@ -118,7 +145,14 @@ class TestAESManager(unittest.TestCase):
         for password in strong_passwords:
             is_valid, message = self.aes.validate_password_strength(password)
             self.assertTrue(is_valid, f"Password '{password}' should be valid")
-    
+
+    def test_password_validation_cased_special(self):
+        """Test that a cased, non-alphanumeric character counts as both classes."""
+        # Circled letters are uppercase but not alphanumeric
+        is_valid, message = self.aes.validate_password_strength('ⒶⒷⒸⒹⒺⒻⒼⒽ')
+        self.assertTrue(is_valid)
+        self.assertEqual(message, "Moderate password")
+
     def test_corrupted_data_fails(self):
         """Test that corrupted encrypted data causes decryption failure."""
         plaintext = "Test message"
@@ -130,6 +164,32 @@ class TestAESManager(unittest.TestCase):
         # Try to decrypt corrupted data
         with self.assertRaises(ValueError):
             self.aes.decrypt_from_string(corrupted_string, self.test_password)
+    
+    @unittest.skipUnless(HAVE_ARGON2, "argon2-cffi not installed")
+    def test_argon2id_kdf(self):
+        """Test encryption round-trip with the Argon2id KDF."""
+        aes = AESManager(kdf='argon2id')
+        encrypted_string = aes.encrypt_to_string("Argon2 message", self.test_password)
+        
+        self.assertEqual(aes.decrypt_from_string(encrypted_string, self.test_password), "Argon2 message")
+        # Keys differ between KDFs, so PBKDF2 cannot decrypt it
+        with self.assertRaises(ValueError):
+            self.aes.decrypt_from_string(encrypted_string, self.test_password)
+    
+    @unittest.skipUnless(FULL_KDF, "set SONICVAULT_FULL_KDF=1 to run")
+    def test_round_trip_at_production_iterations(self):
+        """Test a round-trip with the default PBKDF2 iteration count."""
+        aes = AESManager()
+        encrypted_string = aes.encrypt_to_string("Full cost", self.test_password)
+        
+        self.assertEqual(aes.decrypt_from_string(encrypted_string, self.test_password), "Full cost")
+        with self.assertRaises(ValueError):
+            self.aes.decrypt_from_string(encrypted_string, self.test_password)
+    
+    def test_unknown_kdf_rejected(self):
+        """Test that an unknown KDF name is rejected."""
+        with self.assertRaises(ValueError):
+            AESManager(kdf='scrypt')
 
 
 if __name__ == '__main__':
@@ -5,15 +5,36 @@ import sys
 import os
 import tempfile
 
+import pytest
+
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../src'))
 
+from tests.fixtures import assert_nonempty
+from cryptography.hazmat.primitives.asymmetric import dsa
+
 from crypto.dsa_manager import DSAManager
 
 class TestDSAManager(unittest.TestCase):
     """Test cases for DSAManager class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Generate the key pairs once; only test_generate_keypair needs fresh ones."""
+        cls._dsa = DSAManager()
+        cls._kp1 = cls._dsa.generate_keypair()
+        cls._kp2 = cls._dsa.generate_keypair()
+        cls._legacy_private = dsa.generate_private_key(key_size=1024)
+        # One scratch directory for file round-trips, in RAM where available
+        cls._tmpdir = tempfile.TemporaryDirectory(dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory."""
+        cls._tmpdir.cleanup()
+    
     def setUp(self):
         """Set up test fixtures."""
+        # A fresh manager per test keeps the key caches isolated; it is cheap
         self.dsa = DSAManager()
         self.test_data = b"Test data for DSA signatures"
     
@@ -26,7 +47,7 @@ class TestDSAManager(unittest.TestCase):
     
     def test_sign_and_verify(self):
         """Test signing and verification."""
-        private_key, public_key = self.dsa.generate_keypair()
+        private_key, public_key = self._kp1
         
         # Sign data
         signature = self.dsa.sign_data(self.test_data, private_key)
@@ -39,7 +60,7 @@ class TestDSAManager(unittest.TestCase):
     
     def test_verify_wrong_data(self):
         """Test verification with wrong data."""
-        private_key, public_key = self.dsa.generate_keypair()
+        private_key, public_key = self._kp1
         signature = self.dsa.sign_data(self.test_data, private_key)
         
         # Verify with wrong data
@@ -49,7 +70,7 @@ class TestDSAManager(unittest.TestCase):
     
     def test_verify_wrong_signature(self):
         """Test verification with wrong signature."""
-        private_key, public_key = self.dsa.generate_keypair()
+        private_key, public_key = self._kp1
         signature = self.dsa.sign_data(self.test_data, private_key)
         
         # Modify signature
@@ -57,9 +78,24 @@ class TestDSAManager(unittest.TestCase):
         is_valid = self.dsa.verify_signature(self.test_data, wrong_signature, public_key)
         self.assertFalse(is_valid)
     
+    def test_verify_signatures_batch(self):
+        """Test verifying several signatures at once."""
+        private_key, public_key = self._kp1
+        other_private, other_public = self._kp2
+        messages = [b"first", b"second", b"third"]
+        items = [(m, self.dsa.sign_data(m, private_key)) for m in messages]
+        items[1] = (b"tampered", items[1][1])
+        
+        self.assertEqual(self.dsa.verify_signatures_batch(items, public_key), [True, False, True])
+        self.assertEqual(
+            self.dsa.verify_signatures_batch(items, [public_key, public_key, other_public]),
+            [True, False, False])
+        with self.assertRaises(ValueError):
+            self.dsa.verify_signatures_batch(items, [public_key])
+    
     def test_key_serialization(self):
         """Test key serialization and deserialization."""
-        private_key, public_key = self.dsa.generate_keypair()
+        private_key, public_key = self._kp1
         
         # Serialize keys
         private_bytes = self.dsa.private_key_to_bytes(private_key)
@@ -79,9 +115,26 @@ class TestDSAManager(unittest.TestCase):
         is_valid = self.dsa.verify_signature(self.test_data, signature, public_key_loaded)
         self.assertTrue(is_valid)
     
+    def test_key_serialization_cache(self):
+        """Test that repeated serialization and loading reuse cached results."""
+        private_key, public_key = self._kp1
+        password = "TestPassword123!"
+        
+        private_bytes = self.dsa.private_key_to_bytes(private_key, password)
+        self.assertIs(self.dsa.private_key_to_bytes(private_key, password), private_bytes)
+        public_bytes = self.dsa.public_key_to_bytes(public_key)
+        self.assertIs(self.dsa.public_key_to_bytes(public_key), public_bytes)
+        
+        loaded = self.dsa.private_key_from_bytes(private_bytes, password)
+        self.assertIs(self.dsa.private_key_from_bytes(private_bytes, password), loaded)
+        # A different password is not served from the cache
+        with self.assertRaises(ValueError):
+            self.dsa.private_key_from_bytes(private_bytes, "WrongPassword123!")
+    
+    @pytest.mark.slow
     def test_key_serialization_with_password(self):
         """Test key serialization with password protection."""
-        private_key, public_key = self.dsa.generate_keypair()
+        private_key, public_key = self._kp1
         password = "TestPassword123!"
         
         # Serialize with password
@@ -100,47 +153,36 @@ class TestDSAManager(unittest.TestCase):
         is_valid = self.dsa.verify_signature(self.test_data, signature, public_key)
         self.assertTrue(is_valid)
     
+    @pytest.mark.slow
     def test_save_and_load_keypair(self):
         """Test saving and loading key pair from files."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='_private.pem') as private_file:
-            private_path = private_file.name
-        with tempfile.NamedTemporaryFile(delete=False, suffix='_public.pem') as public_file:
-            public_path = public_file.name
-        
-        try:
-            # Generate and save keys
-            private_key, public_key = self.dsa.generate_keypair()
-            self.dsa.save_keypair(private_key, public_key, private_path, public_path)
-            
-            # Verify files exist
-            self.assertTrue(os.path.exists(private_path))
-            self.assertTrue(os.path.exists(public_path))
-            self.assertGreater(os.path.getsize(private_path), 0)
-            self.assertGreater(os.path.getsize(public_path), 0)
-            
-            # Load keys
-            private_key_loaded, public_key_loaded = self.dsa.load_keypair(private_path, public_path)
-            
-            # Test loaded keys
-            signature = self.dsa.sign_data(self.test_data, private_key_loaded)
-            is_valid = self.dsa.verify_signature(self.test_data, signature, public_key_loaded)
-            self.assertTrue(is_valid)
-            
-        finally:
-            # Clean up
-            if os.path.exists(private_path):
-                os.unlink(private_path)
-            if os.path.exists(public_path):
-                os.unlink(public_path)
+        private_path = os.path.join(self._tmpdir.name, 'keypair_private.pem')
+        public_path = os.path.join(self._tmpdir.name, 'keypair_public.pem')
+        
+        # Save keys
+        private_key, public_key = self._kp1
+        self.dsa.save_keypair(private_key, public_key, private_path, public_path)
+        
+        # Verify files exist and have content
+        assert_nonempty(self, private_path)
+        assert_nonempty(self, public_path)
+        
+        # Load keys
+        private_key_loaded, public_key_loaded = self.dsa.load_keypair(private_path, public_path)
+        
+        # Test loaded keys
+        signature = self.dsa.sign_data(self.test_data, private_key_loaded)
+        is_valid = self.dsa.verify_signature(self.test_data, signature, public_key_loaded)
+        self.assertTrue(is_valid)
     
     def test_sign_and_combine(self):
         """Test combined signing and extraction."""
-        private_key, public_key = self.dsa.generate_keypair()
+        private_key, public_key = self._kp1
         
         # Sign and combine
         combined = self.dsa.sign_and_combine(self.test_data, private_key)
         self.assertIsNotNone(combined)
-        self.assertGreater(len(combined), len(self.test_data))
+        self.assertEqual(len(combined), len(self.test_data) + 64)
         
         # Verify and extract
         extracted_data, is_valid = self.dsa.verify_and_extract(combined, public_key)
@@ -148,9 +190,20 @@ class TestDSAManager(unittest.TestCase):
         self.assertEqual(extracted_data, self.test_data)
         self.assertTrue(is_valid)
     
+    def test_raw_public_key(self):
+        """Test raw 32-byte public key round trip."""
+        private_key, public_key = self._kp1
+        
+        raw = self.dsa.public_key_to_raw(public_key)
+        self.assertEqual(len(raw), 32)
+        
+        signature = self.dsa.sign_data(self.test_data, private_key)
+        loaded = self.dsa.public_key_from_raw(raw)
+        self.assertTrue(self.dsa.verify_signature(self.test_data, signature, loaded))
+    
     def test_verify_and_extract_invalid(self):
         """Test extraction with invalid combined data."""
-        private_key, public_key = self.dsa.generate_keypair()
+        private_key, public_key = self._kp1
         
         # Test with too short data
         short_data = b"short"
@@ -165,10 +218,40 @@ class TestDSAManager(unittest.TestCase):
         self.assertEqual(extracted, b'')
         self.assertFalse(is_valid)
     
+    def test_legacy_dsa_keys(self):
+        """Test that previously generated DSA keys still sign and verify."""
+        private_key = self.dsa.private_key_from_bytes(
+            self.dsa.private_key_to_bytes(self._legacy_private))
+        public_key = private_key.public_key()
+        
+        signature = self.dsa.sign_data(self.test_data, private_key)
+        self.assertTrue(self.dsa.verify_signature(self.test_data, signature, public_key))
+        self.assertFalse(self.dsa.verify_signature(self.test_data + b"x", signature, public_key))
+    
+    def test_prehashed_signing(self):
+        """Test that digest signatures interoperate with full-data signatures."""
+        import hashlib
+        
+        private_key = self._legacy_private
+        public_key = private_key.public_key()
+        digest = hashlib.sha256(self.test_data).digest()
+        
+        signature = self.dsa.sign_prehashed(digest, private_key)
+        self.assertTrue(self.dsa.verify_signature(self.test_data, signature, public_key))
+        
+        signature = self.dsa.sign_data(self.test_data, private_key)
+        self.assertTrue(self.dsa.verify_prehashed(digest, signature, public_key))
+        self.assertFalse(self.dsa.verify_prehashed(hashlib.sha256(b"other").digest(), signature, public_key))
+        
+        # Pure Ed25519 has no prehashed mode
+        ed_private, _ = self._kp1
+        with self.assertRaises(ValueError):
+            self.dsa.sign_prehashed(digest, ed_private)
+    
     def test_different_keys_dont_work(self):
         """Test that keys from different pairs don't work together."""
-        private_key1, public_key1 = self.dsa.generate_keypair()
-        private_key2, public_key2 = self.dsa.generate_keypair()
+        private_key1, public_key1 = self._kp1
+        private_key2, public_key2 = self._kp2
         
         # Sign with key1
         signature = self.dsa.sign_data(self.test_data, private_key1)
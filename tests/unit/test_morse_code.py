@@ -11,6 +11,15 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../src'))
 
 from utils.morse_code import MorseCode
 
+# Known-good (text, morse) pairs, checked in both directions by test_known_encodings
+_EXPECTED = (
+    ("SOS", "... --- ..."),
+    ("HELLO WORLD", ".... . .-.. .-.. --- / .-- --- .-. .-.. -.."),
+    ("TEST 123!", "- . ... - / .---- ..--- ...-- -.-.--"),
+    ("PYTHON PROGRAMMING", ".--. -.-- - .... --- -. / .--. .-. --- --. .-. .- -- -- .. -. --."),
+    ("MORSE CODE IS COOL", "-- --- .-. ... . / -.-. --- -.. . / .. ... / -.-. --- --- .-.."),
+)
+
 class TestMorseCode(unittest.TestCase):
     """Test cases for MorseCode class."""
     
@@ -84,6 +93,13 @@ class TestMorseCode(unittest.TestCase):
                 decoded = self.morse.morse_to_text(morse)
                 self.assertEqual(message.upper(), decoded)
     
+    def test_known_encodings(self):
+        """Test both directions against precomputed encodings."""
+        for text, morse in _EXPECTED:
+            with self.subTest(text=text):
+                self.assertEqual(self.morse.text_to_morse(text), morse)
+                self.assertEqual(self.morse.morse_to_text(morse), text)
+    
     def test_validate_text(self):
         """Test text validation."""
         self.assertTrue(self.morse.validate_text("HELLO"))
@@ -7,16 +7,56 @@ import sys
 import os
 import tempfile
 
+import pytest
+
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../src'))
 
+from tests.fixtures import assert_nonempty
 from core.sonic_vault import SonicVault
 
 class TestSonicVault(unittest.TestCase):
     """Test cases for SonicVault class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared vault and one scratch directory, in RAM where available."""
+        cls._vault = SonicVault()
+        cls._tmpdir = tempfile.TemporaryDirectory(dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+        # One signing key pair on disk for every test that needs a signer
+        cls._priv = os.path.join(cls._tmpdir.name, 'shared_private.pem')
+        cls._pub = os.path.join(cls._tmpdir.name, 'shared_public.pem')
+        cls._vault.generate_keypair(cls._priv, cls._pub)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory."""
+        cls._tmpdir.cleanup()
+    
+    def _path(self, suffix):
+        """Scratch file path unique to the running test."""
+        return os.path.join(self._tmpdir.name, self._testMethodName + suffix)
+    
+    def _encode_and_assert(self, theme='sine', sign=False, **kwargs):
+        """Encode the test message into the scratch dir and check the WAV was written."""
+        output_path = self._path('.wav')
+        result = self.vault.encode_message(
+            message=self.test_message,
+            password=self.test_password,
+            output_file=output_path,
+            theme=theme,
+            sign=sign,
+            **kwargs
+        )
+        
+        self.assertTrue(result['success'])
+        assert_nonempty(self, output_path)
+        return result, output_path
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.vault = SonicVault()
+        self.vault = self._vault
+        # Encoding switches the theme on the shared vault; start from the default
+        self.vault.sound_gen.set_theme('sine')
         self.test_message = "Test message for SonicVault"
         self.test_password = "TestPassword123!"
     
@@ -53,102 +93,44 @@ class TestSonicVault(unittest.TestCase):
         self.assertIn('components', info)
         self.assertIn('default_key_paths', info)
         self.assertEqual(info['version'], '1.0.0')
+        self.assertIn(info['components']['aes_backend'],
+                      ('AES-NI+VAES', 'AES-NI', 'software', 'unknown'))
     
     def test_generate_keypair(self):
         """Test key pair generation."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='_private.pem') as private_file:
-            private_path = private_file.name
-        with tempfile.NamedTemporaryFile(delete=False, suffix='_public.pem') as public_file:
-            public_path = public_file.name
+        private_path = self._path('_private.pem')
+        public_path = self._path('_public.pem')
+        result = self.vault.generate_keypair(private_path, public_path)
         
-        try:
-            result = self.vault.generate_keypair(private_path, public_path)
-            
-            self.assertTrue(result['success'])
-            self.assertEqual(result['private_key_path'], private_path)
-            self.assertEqual(result['public_key_path'], public_path)
-            self.assertTrue(os.path.exists(private_path))
-            self.assertTrue(os.path.exists(public_path))
-            
-        finally:
-            if os.path.exists(private_path):
-                os.unlink(private_path)
-            if os.path.exists(public_path):
-                os.unlink(public_path)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['private_key_path'], private_path)
+        self.assertEqual(result['public_key_path'], public_path)
+        assert_nonempty(self, private_path)
+        assert_nonempty(self, public_path)
     
     def test_encode_message_basic(self):
         """Test basic message encoding."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-            output_path = temp_file.name
+        result, output_path = self._encode_and_assert()  # Don't sign for basic test
         
-        try:
-            result = self.vault.encode_message(
-                message=self.test_message,
-                password=self.test_password,
-                output_file=output_path,
-                theme='sine',
-                sign=False  # Don't sign for basic test
-            )
-            
-            self.assertTrue(result['success'])
-            self.assertEqual(result['output_file'], output_path)
-            self.assertEqual(result['theme'], 'sine')
-            self.assertEqual(result['signed'], False)
-            self.assertTrue(os.path.exists(output_path))
-            self.assertGreater(os.path.getsize(output_path), 0)
-            
-        finally:
-            if os.path.exists(output_path):
-                os.unlink(output_path)
+        self.assertEqual(result['output_file'], output_path)
+        self.assertEqual(result['theme'], 'sine')
+        self.assertEqual(result['signed'], False)
     
     def test_encode_message_with_signature(self):
         """Test message encoding with digital signature."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as audio_file:
-            audio_path = audio_file.name
-        with tempfile.NamedTemporaryFile(delete=False, suffix='_private.pem') as private_file:
-            private_path = private_file.name
-        with tempfile.NamedTemporaryFile(delete=False, suffix='_public.pem') as public_file:
-            public_path = public_file.name
+        result, _ = self._encode_and_assert(sign=True, private_key_path=self._priv)
         
-        try:
-            # First generate key pair
-            self.vault.generate_keypair(private_path, public_path)
-            
-            # Encode with signature
-            result = self.vault.encode_message(
-                message=self.test_message,
-                password=self.test_password,
-                output_file=audio_path,
-                theme='sine',
-                sign=True,
-                private_key_path=private_path
-            )
-            
-            self.assertTrue(result['success'])
-            self.assertEqual(result['signed'], True)
-            self.assertTrue(os.path.exists(audio_path))
-            
-        finally:
-            for path in [audio_path, private_path, public_path]:
-                if os.path.exists(path):
-                    os.unlink(path)
+        self.assertEqual(result['signed'], True)
     
     def test_encode_message_invalid_theme(self):
         """Test encoding with invalid theme."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-            output_path = temp_file.name
-        
-        try:
-            with self.assertRaises(ValueError):
-                self.vault.encode_message(
-                    message=self.test_message,
-                    password=self.test_password,
-                    output_file=output_path,
-                    theme='invalid_theme'
-                )
-        finally:
-            if os.path.exists(output_path):
-                os.unlink(output_path)
+        with self.assertRaises(ValueError):
+            self.vault.encode_message(
+                message=self.test_message,
+                password=self.test_password,
+                output_file=self._path('.wav'),
+                theme='invalid_theme'
+            )
     
     def test_encode_message_empty_inputs(self):
         """Test encoding with empty inputs."""
@@ -160,31 +142,31 @@ class TestSonicVault(unittest.TestCase):
         
         with self.assertRaises(ValueError):
             self.vault.encode_message(self.test_message, self.test_password, "")
-    
-    def test_encode_with_different_themes(self):
-        """Test encoding with different audio themes."""
-        themes = self.vault.get_audio_themes()
-        
-        for theme in themes:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-                output_path = temp_file.name
-            
-            try:
-                result = self.vault.encode_message(
-                    message=self.test_message,
-                    password=self.test_password,
-                    output_file=output_path,
-                    theme=theme,
-                    sign=False
-                )
-                
-                self.assertTrue(result['success'])
-                self.assertEqual(result['theme'], theme)
-                self.assertTrue(os.path.exists(output_path))
-                
-            finally:
-                if os.path.exists(output_path):
-                    os.unlink(output_path)
+
+
+@pytest.fixture(scope='module')
+def vault_fixture():
+    """One SonicVault shared by the parametrized tests in this module."""
+    return SonicVault()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('theme', SonicVault.get_audio_themes())
+def test_encode_theme(vault_fixture, tmp_path_factory, theme):
+    """Test encoding with each audio theme, one test per theme."""
+    output_path = str(tmp_path_factory.mktemp('wav') / 'out.wav')
+    result = vault_fixture.encode_message(
+        message="Test message for SonicVault",
+        password="TestPassword123!",
+        output_file=output_path,
+        theme=theme,
+        sign=False
+    )
+
+    assert result['success']
+    assert result['theme'] == theme
+    # One stat: raises if the file is missing, so existence is implied
+    assert os.stat(output_path).st_size > 0
 
 
 if __name__ == '__main__':
@@ -2,25 +2,47 @@
 Unit tests for sound generator.
 """
 
+import io
 import unittest
 import sys
 import os
 import tempfile
+from unittest import mock
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../src'))
 
-from audio.sound_generator import SoundGenerator
+from tests.fixtures import assert_nonempty
+from audio.sound_generator import SoundGenerator, AudioSegment
 from audio.binary_encoder import BinaryEncoder
 from utils.morse_code import MorseCode
 
 class TestSoundGenerator(unittest.TestCase):
     """Test cases for SoundGenerator class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared fixtures and one scratch directory, in RAM where available."""
+        cls._sound_gen = SoundGenerator()
+        cls._encoder = BinaryEncoder()
+        cls._morse = MorseCode()
+        cls._tmpdir = tempfile.TemporaryDirectory(dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory."""
+        cls._tmpdir.cleanup()
+    
+    def _path(self, suffix):
+        """Scratch file path unique to the running test."""
+        return os.path.join(self._tmpdir.name, self._testMethodName + suffix)
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.sound_gen = SoundGenerator()
-        self.encoder = BinaryEncoder()
-        self.morse = MorseCode()
+        self.sound_gen = self._sound_gen
+        self.encoder = self._encoder
+        self.morse = self._morse
+        # Tests switch themes on the shared generator; start each from the default
+        self.sound_gen.set_theme('sine')
     
     def test_initialization(self):
         """Test sound generator initialization."""
@@ -67,6 +89,44 @@ class TestSoundGenerator(unittest.TestCase):
                 self.assertIsNotNone(dash_sound)
                 self.assertGreater(len(dash_sound), 0)
     
+    def test_fast_math_matches_exact_sine(self):
+        """Test the approximate sine stays close to np.sin."""
+        timings = [(0.2, 0.2), (0.6, 0.2)]
+        
+        # fast_math only applies to the NumPy path; force it even when Numba
+        # is installed, with fresh generators so no cached tones are reused
+        with mock.patch('audio.sound_generator.HAVE_NUMBA', False):
+            fast = SoundGenerator({'fast_math': True}).timing_to_audio(timings).audio_array
+            exact = SoundGenerator({'fast_math': False}).timing_to_audio(timings).audio_array
+        
+        self.assertEqual(len(fast), len(exact))
+        max_error = float(abs(fast - exact).max())
+        self.assertGreater(max_error, 0.0)  # the approximation actually ran
+        self.assertLess(max_error, 2e-3)
+    
+    def test_seed_makes_noise_reproducible(self):
+        """Test seeded generators produce identical noisy themes."""
+        timings = [(0.2, 0.2), (0.6, 0.2)]
+        outputs = []
+        for _ in range(2):
+            sound_gen = SoundGenerator({'seed': 1234})
+            sound_gen.set_theme('rain')
+            outputs.append(sound_gen.timing_to_audio(timings).audio_array)
+        
+        self.assertTrue((outputs[0] == outputs[1]).all())
+    
+    def test_concat_segments(self):
+        """Test joining several segments at once."""
+        dot = self.sound_gen.generate_sound_segment(0.2, 'dot')
+        gap = self.sound_gen.generate_silence(0.2)
+        
+        joined = AudioSegment.concat([dot, gap, dot])
+        self.assertEqual(len(joined.audio_array), 2 * len(dot.audio_array) + len(gap.audio_array))
+        self.assertTrue(((dot + gap + dot).audio_array == joined.audio_array).all())
+        
+        with self.assertRaises(ValueError):
+            AudioSegment.concat([dot, AudioSegment(gap.audio_array, 22050)])
+    
     def test_timing_to_audio_basic(self):
         """Test basic timing to audio conversion."""
         # Simple timing: dot then dash
@@ -90,26 +150,18 @@ class TestSoundGenerator(unittest.TestCase):
         self.assertEqual(len(audio), 1000)  # Default 1 second silence
     
     def test_save_audio(self):
-        """Test audio file saving."""
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_path = temp_file.name
-        
-        try:
-            # Generate simple audio
-            timings = [(0.1, 0.1)]
-            audio = self.sound_gen.timing_to_audio(timings)
-            
-            # Save audio
-            self.sound_gen.save_audio(audio, temp_path)
-            
-            # Check file exists and has content
-            self.assertTrue(os.path.exists(temp_path))
-            self.assertGreater(os.path.getsize(temp_path), 0)
-            
-        finally:
-            # Clean up
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        """Test audio saving to a file object."""
+        # Generate simple audio
+        timings = [(0.1, 0.1)]
+        audio = self.sound_gen.timing_to_audio(timings)
+        
+        # Save audio
+        buffer = io.BytesIO()
+        self.sound_gen.save_audio(audio, buffer)
+        
+        # Check a WAV stream was written
+        assert_nonempty(self, buffer)
+        self.assertEqual(buffer.getvalue()[:4], b'RIFF')
     
     def test_full_pipeline(self):
         """Test full pipeline: text -> morse -> binary -> timing -> audio."""
@@ -133,20 +185,28 @@ class TestSoundGenerator(unittest.TestCase):
     
     def test_generate_from_timing_and_save(self):
         """Test combined generation and saving."""
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_path = temp_file.name
-        
-        try:
-            timings = [(0.1, 0.1), (0.2, 0.1)]
-            audio = self.sound_gen.generate_from_timing_and_save(timings, temp_path)
-            
-            self.assertIsNotNone(audio)
-            self.assertTrue(os.path.exists(temp_path))
-            self.assertGreater(os.path.getsize(temp_path), 0)
-            
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        temp_path = self._path('.wav')
+        timings = [(0.1, 0.1), (0.2, 0.1)]
+        audio = self.sound_gen.generate_from_timing_and_save(timings, temp_path)
+        
+        self.assertIsNotNone(audio)
+        assert_nonempty(self, temp_path)
+    
+    def test_generate_from_timing_and_save_streaming(self):
+        """Test streaming generation matches the buffered output length."""
+        temp_path = self._path('.wav')
+        timings = [(0.2, 0.2), (0.6, 0.2)] * 5
+        duration = self.sound_gen.generate_from_timing_and_save_streaming(
+            timings, temp_path, block_size=3)
+        
+        expected = self.sound_gen.timing_to_audio(timings)
+        self.assertAlmostEqual(duration * 1000, len(expected), delta=1)
+        assert_nonempty(self, temp_path)
+        
+        # A generator is consumed block by block to the same length
+        streamed = self.sound_gen.generate_from_timing_and_save_streaming(
+            iter(timings), temp_path, block_size=4)
+        self.assertEqual(streamed, duration)
 
 
 if __name__ == '__main__':